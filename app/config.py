@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     snowflake_schema: str = "PUBLIC"
     snowflake_warehouse: str = "COMPUTE_WH"
     snowflake_role: str = "SYSADMIN"
+    snowflake_pool_size: int = 10
 
     # DO Spaces
     do_spaces_key: str
@@ -4,7 +4,7 @@ EduVoice FastAPI Application Entry Point
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from loguru import logger
 
 from app.config import get_settings
@@ -21,6 +21,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # ─── CORS ─────────────────────────────────────────────────────────────────────
@@ -43,6 +44,35 @@ app.include_router(admin.router)
 app.include_router(test.router, prefix="/test", tags=["Tests"])
 app.include_router(student.router)
 
+# ─── Lifecycle ────────────────────────────────────────────────────────────────
+@app.on_event("startup")
+async def startup_background_tasks():
+    from app.services.snowflake_db import start_event_flusher
+    start_event_flusher()
+
+
+@app.on_event("startup")
+async def prewarm_clients():
+    # Build the lazily-constructed SDK clients now so the first real request
+    # doesn't pay for it. Only local construction — the Gemini client is
+    # already built at import, and Snowflake connections are deliberately
+    # left to fill the pool on demand so a warehouse hiccup can't block boot.
+    import asyncio
+    from app.services.storage import _get_client
+    try:
+        await asyncio.to_thread(_get_client)
+    except Exception as e:  # best-effort — never block boot on a warm-up
+        logger.warning(f"[Startup] Spaces client prewarm skipped: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    from app.services.learning_pathway import close_http_client
+    from app.services.snowflake_db import close_pool, stop_event_flusher
+    await close_http_client()
+    await stop_event_flusher()
+    close_pool()
+
 # ─── Global Error Handler ─────────────────────────────────────────────────────
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -3,7 +3,7 @@ Lesson router — content generation, assignment, and retrieval.
 """
 
 import uuid
-import json
+import orjson
 import asyncio
 from datetime import datetime, timezone
 from typing import Optional
@@ -21,7 +21,7 @@ from app.models.schemas import (
     LessonUpdateRequest,
     AssignmentSubmitRequest,
 )
-from app.services import gemini, elevenlabs, snowflake_db, storage, learning_pathway, disability_pathway
+from app.services import gemini, elevenlabs, snowflake_db, storage, learning_pathway, disability_pathway, semantic_cache
 from app.utils.audio import detect_mime_type
 
 router = APIRouter(prefix="/lesson", tags=["Lesson"])
@@ -61,10 +61,25 @@ async def generate_lesson(
     """
     lesson_id = str(uuid.uuid4())
 
+    # 0. Cache lookup — repeated classroom topics skip the LLM entirely.
+    # Custom base_text lessons are teacher-specific, so they bypass the cache.
+    cached = None
+    if not req.base_text:
+        cached = await semantic_cache.lookup(
+            topic=req.topic,
+            grade=req.grade,
+            tiers=req.tiers,
+            language=req.language,
+            learning_style=req.learning_style or "none",
+        )
+
     # 1. Generate tiered content via LangGraph (Learning Style Specific)
     try:
         # Use LangGraph workflow if learning_style is provided, fallback to standard Gemini
-        if req.learning_style and req.learning_style != "none":
+        if cached is not None:
+            logger.info("[Lesson] Serving generation from semantic cache")
+            gemini_response = cached
+        elif req.learning_style and req.learning_style != "none":
             logger.info(f"[Lesson] Using LangGraph for style: {req.learning_style}")
             gemini_response = await learning_pathway.generate_styled_lesson(
                 topic=req.topic,
@@ -91,6 +106,16 @@ async def generate_lesson(
     if not raw_tiers:
         raise HTTPException(status_code=502, detail="Gemini returned empty tiers")
 
+    if cached is None and not req.base_text:
+        await semantic_cache.store(
+            topic=req.topic,
+            grade=req.grade,
+            tiers=req.tiers,
+            language=req.language,
+            content=gemini_response,
+            learning_style=req.learning_style or "none",
+        )
+
     # 2. Generate TTS audio per tier (concurrent)
     tiers_out: list[LessonTier] = []
 
@@ -102,7 +127,7 @@ async def generate_lesson(
         if req.generate_audio and passage:
             try:
                 audio_bytes = await elevenlabs.tts(passage)
-                audio_url = storage.upload_audio(
+                audio_url = await storage.upload_audio(
                     audio_bytes,
                     prefix=f"lessons/{lesson_id}",
                     filename=f"tier_{level}",
@@ -197,7 +222,7 @@ async def generate_adaptive_material(
             # Truncate for TTS (ElevenLabs has limits)
             tts_text = passage[:4500]
             audio_bytes = await elevenlabs.tts(tts_text)
-            audio_url = storage.upload_audio(
+            audio_url = await storage.upload_audio(
                 audio_bytes,
                 prefix=f"lessons/{lesson_id}/adaptive",
                 filename=f"{category}_audio",
@@ -292,11 +317,14 @@ async def get_adapted_lesson(
     Fetch a lesson and adapt the Tier 1 passage dynamically for the user's
     specific disability_type and learning_style using LangGraph.
     """
-    lesson = await snowflake_db.get_lesson(lesson_id)
+    # Independent lookups — fetch concurrently instead of paying two RTTs.
+    lesson, db_user = await asyncio.gather(
+        snowflake_db.get_lesson(lesson_id),
+        snowflake_db.get_user(user.user_id),
+    )
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
-        
-    db_user = await snowflake_db.get_user(user.user_id)
+
     if not db_user:
         raise HTTPException(status_code=404, detail="User profile not found")
         
@@ -305,7 +333,7 @@ async def get_adapted_lesson(
     
     content_json = lesson.get("content_json", {})
     if isinstance(content_json, str):
-        content_json = json.loads(content_json)
+        content_json = orjson.loads(content_json)
     
     # ── Check for pre-generated adaptive material ──
     if content_json.get("is_adaptive") and content_json.get("adaptive_versions"):
@@ -443,7 +471,7 @@ async def submit_video_assignment(
         transcript = eval_result.get("transcript", "No transcript")
         raw_score = float(eval_result.get("score", 0))
         
-        student_response = json.dumps(eval_result)
+        student_response = orjson.dumps(eval_result).decode()
         
         # 2. Update DB with transcript and raw score
         await snowflake_db.submit_assignment(assignment_id, student_response, raw_score)
@@ -474,7 +502,7 @@ async def get_teacher_submissions(
             FROM assignments a
             JOIN lessons l ON a.lesson_id = l.lesson_id
             JOIN users u on a.assigned_to = u.user_id
-            WHERE l.teacher_id = %s AND a.status IN ('submitted', 'reviewed')
+            WHERE l.teacher_id = ? AND a.status IN ('submitted', 'reviewed')
             ORDER BY a.created_at DESC
         """
         rows = await snowflake_db.execute(sql, (user.user_id,), fetch=True)
@@ -536,9 +564,9 @@ async def review_assignment(
         sql = """
             UPDATE assignments
             SET status = 'reviewed',
-                raw_score = %s,
-                student_response = COALESCE(student_response, '') || '\n\n[Teacher]: ' || %s
-            WHERE assignment_id = %s AND status = 'submitted'
+                raw_score = ?,
+                student_response = COALESCE(student_response, '') || '\n\n[Teacher]: ' || ?
+            WHERE assignment_id = ? AND status = 'submitted'
         """
         await snowflake_db.execute(sql, (req.final_score, req.teacher_feedback, assignment_id))
         return {"status": "success"}
@@ -3,8 +3,11 @@ Practice router — voice sessions, speech analysis, AAC support.
 """
 
 import uuid
+import orjson
+import asyncio
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from functools import lru_cache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form
 from fastapi.responses import Response
 from loguru import logger
 
@@ -25,6 +28,20 @@ from app.utils.audio import detect_mime_type
 router = APIRouter(prefix="/practice", tags=["Practice"])
 
 
+@lru_cache(maxsize=256)
+def _parse_accessibility(raw: str) -> AccessibilityProfile:
+    """Parses the accessibility_json form field, defaulting on bad input.
+
+    Cached — most clients send "{}" or one of a handful of profiles, so the
+    JSON parse + model validation runs once per distinct payload. Callers
+    only read the returned profile.
+    """
+    try:
+        return AccessibilityProfile(**orjson.loads(raw))
+    except Exception:
+        return AccessibilityProfile()
+
+
 @router.post("/session/start", response_model=SessionStartResponse)
 async def start_session(
     req: SessionStartRequest,
@@ -55,6 +72,7 @@ async def start_session(
 
 @router.post("/speech-analyze", response_model=SpeechAnalyzeResponse)
 async def analyze_speech(
+    background_tasks: BackgroundTasks,
     session_id: str = Form(...),
     mode: str = Form("read-aloud"),
     accessibility_json: str = Form("{}"),
@@ -70,14 +88,7 @@ async def analyze_speech(
     4. Optionally generate ElevenLabs spoken feedback
     5. Save artifact to Snowflake
     """
-    import json as _json
-
-    # Parse accessibility profile
-    try:
-        acc_data = _json.loads(accessibility_json)
-        acc = AccessibilityProfile(**acc_data)
-    except Exception:
-        acc = AccessibilityProfile()
+    acc = _parse_accessibility(accessibility_json)
 
     # Read uploaded audio
     audio_bytes = await audio.read()
@@ -86,17 +97,21 @@ async def analyze_speech(
 
     mime_type = detect_mime_type(audio.filename or "audio.wav", audio_bytes)
 
-    # Upload student recording to DO Spaces
-    try:
-        audio_url = storage.upload_audio(
-            audio_bytes,
-            prefix=f"recordings/{session_id}",
-            content_type=mime_type,
-            filename="student_audio",
-        )
-    except Exception as e:
-        logger.warning(f"[Practice] Audio upload failed: {e}")
-        audio_url = ""
+    # Upload the student recording to DO Spaces concurrently with the
+    # transcribe → analyze chain — neither side needs the other's result.
+    async def _upload_recording() -> str:
+        try:
+            return await storage.upload_audio(
+                audio_bytes,
+                prefix=f"recordings/{session_id}",
+                content_type=mime_type,
+                filename="student_audio",
+            )
+        except Exception as e:
+            logger.warning(f"[Practice] Audio upload failed: {e}")
+            return ""
+
+    upload_task = asyncio.create_task(_upload_recording())
 
     # Transcribe audio via ElevenLabs
     try:
@@ -140,7 +155,7 @@ async def analyze_speech(
             feedback_bytes = await elevenlabs.spoken_feedback(
                 feedback_text, neurodivergent=acc.sensory_friendly
             )
-            spoken_feedback_url = storage.upload_audio(
+            spoken_feedback_url = await storage.upload_audio(
                 feedback_bytes,
                 prefix=f"feedback/{session_id}",
                 filename="spoken_feedback",
@@ -148,8 +163,11 @@ async def analyze_speech(
         except Exception as e:
             logger.warning(f"[Practice] Spoken feedback generation failed: {e}")
 
-    # Save to Snowflake
-    await snowflake_db.save_artifact(
+    # Save to Snowflake after the response is sent — the student doesn't
+    # need to wait on the insert, and the upload has finished by now.
+    audio_url = await upload_task
+    background_tasks.add_task(
+        snowflake_db.save_artifact,
         session_id=session_id,
         audio_url=audio_url,
         transcript_text=transcript,
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
@@ -90,21 +91,22 @@ async def get_student_tests(
     assignments = await snowflake_db.get_student_assignments(assigned_to)
     
     # Filter for tests and hydrate the full test object
-    test_assignments = [a for a in assignments if a.get("type") == "test"]
-    
+    test_assignments = [a for a in assignments if a.get("type") == "test" and a.get("test_id")]
+
+    # Hydrate all tests concurrently — one await instead of one RTT per test.
+    results = await asyncio.gather(
+        *(snowflake_db.get_test(ta["test_id"]) for ta in test_assignments)
+    )
+
     hydrated_tests = []
-    for ta in test_assignments:
-        test_id = ta.get("test_id")
-        if not test_id: continue
-        
-        test_data = await snowflake_db.get_test(test_id)
+    for ta, test_data in zip(test_assignments, results):
         if test_data:
             # Add assignment specific data
             test_data["assignment_id"] = ta["assignment_id"]
             test_data["due_date"] = ta["due_date"]
             test_data["status"] = ta["status"]
             hydrated_tests.append(test_data)
-            
+
     return hydrated_tests
 
 @router.get("/{test_id}")
@@ -6,6 +6,10 @@ settings = get_settings()
 
 API_URL = "https://router.huggingface.co/hf-inference/models/distil-whisper/distil-large-v3"
 
+# Shared client — keeps the TLS connection to the inference endpoint warm
+# instead of paying a full handshake per transcription.
+_client = httpx.AsyncClient(timeout=60.0)
+
 async def transcribe_audio(audio_bytes: bytes) -> str:
     """
     Transcribes audio using Hugging Face's Inference API (Distil-Whisper model).
@@ -19,11 +23,11 @@ async def transcribe_audio(audio_bytes: bytes) -> str:
     
     logger.info(f"[HuggingFace] Transcribing audio ({len(audio_bytes)} bytes) using {API_URL}")
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        # Some models require specific parameters or query formats, but Whisper 
-        # usually just takes the audio bytes directly.
-        response = await client.post(API_URL, headers=headers, content=audio_bytes)
-        
+    # Some models require specific parameters or query formats, but Whisper
+    # usually just takes the audio bytes directly.
+    response = await _client.post(API_URL, headers=headers, content=audio_bytes)
+
+
     if response.status_code != 200:
         # Log the first 200 chars of the error to avoid cluttering logs if it's HTML
         error_snippet = response.text[:200].replace("\n", " ")
@@ -3,8 +3,12 @@ LangGraph workflow for learning style-specific content generation.
 Uses Gemini (via LangChain OpenAI adapter) as the central model.
 """
 
-import json
+import os
+import re
+import orjson
+from functools import lru_cache
 from typing import TypedDict, Optional, List, Dict, Any
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.graph import StateGraph, END
@@ -25,16 +29,31 @@ class GraphState(TypedDict):
     learning_style: str
     generated_content: Optional[Dict[str, Any]]
     iterations: int
-    error: Optional[str]
 
 
 # ─── Nodes ───────────────────────────────────────────────────────────────────
 
+# Shared async HTTP client: HTTP/2 multiplexes concurrent generations over one
+# TCP+TLS connection instead of paying a handshake per ChatOpenAI instance.
+_HTTP = httpx.AsyncClient(
+    http2=True,
+    timeout=60.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+)
+
+
+async def close_http_client():
+    """Shutdown hook — drains the shared keep-alive pool."""
+    await _HTTP.aclose()
+
+
+@lru_cache()
 def get_model():
     return ChatOpenAI(
         model=settings.gemini_model,
         openai_api_key=settings.gemini_api_key,
         openai_api_base=settings.gemini_base_url,
+        http_async_client=_HTTP,
         temperature=0.7,
     )
 
@@ -112,17 +131,6 @@ async def general_generator_node(state: GraphState) -> Dict[str, Any]:
     response = await model.ainvoke([SystemMessage(content=sys), HumanMessage(content=usr)])
     return {"generated_content": _parse_json(response.content)}
 
-async def validator_node(state: GraphState) -> Dict[str, Any]:
-    """Node to ensure the output JSON is valid and complete."""
-    content = state.get("generated_content")
-    if not content or "tiers" not in content:
-        logger.warning("[LangGraph] Validation failed: missing 'tiers'")
-        return {"error": "Invalid JSON structure"}
-    
-    logger.info("[LangGraph] Node: Validator | Success")
-    return {"error": None}
-
-
 # ─── Routing ─────────────────────────────────────────────────────────────────
 
 def route_by_style(state: GraphState) -> str:
@@ -144,7 +152,6 @@ workflow.add_node("auditory_gen", auditory_generator_node)
 workflow.add_node("kinesthetic_gen", kinesthetic_generator_node)
 workflow.add_node("reading_gen", reading_writing_generator_node)
 workflow.add_node("general_gen", general_generator_node)
-workflow.add_node("validator", validator_node)
 
 workflow.set_entry_point("classifier")
 
@@ -160,27 +167,39 @@ workflow.add_conditional_edges(
     }
 )
 
+# Generators go straight to END — output validation happens once in
+# generate_styled_lesson instead of costing an extra graph hop per request.
 for gen_node in ["visual_gen", "auditory_gen", "kinesthetic_gen", "reading_gen", "general_gen"]:
-    workflow.add_edge(gen_node, "validator")
-
-workflow.add_edge("validator", END)
+    workflow.add_edge(gen_node, END)
 
 app = workflow.compile()
 
+# Pre-materialized node lookup for the fast path — avoids re-routing through the
+# compiled graph (and its per-node state copies) when the style is already known.
+_NODES = {
+    "visual_gen": visual_generator_node,
+    "auditory_gen": auditory_generator_node,
+    "kinesthetic_gen": kinesthetic_generator_node,
+    "reading_gen": reading_writing_generator_node,
+    "general_gen": general_generator_node,
+}
+
 
 # ─── Helper ──────────────────────────────────────────────────────────────────
 
+# Matches an optional ```json fence (any case) around the payload in one pass —
+# no intermediate list allocation, and "JSON"/"json\n" variants parse correctly.
+_FENCE = re.compile(r"```(?:json)?\s*(.+?)\s*```", re.S | re.I)
+
+
 def _parse_json(raw: str) -> Dict[str, Any]:
     """Strips markdown fences and parses JSON."""
-    if "```" in raw:
-        raw = raw.split("```")[1]
-        if raw.startswith("json"):
-            raw = raw[4:]
-    raw = raw.strip()
+    m = _FENCE.search(raw)
+    payload = (m.group(1) if m else raw).strip()
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        logger.error(f"[LangGraph] JSON Parse Error: {raw[:200]}...")
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        logger.error(f"[LangGraph] JSON Parse Error: {payload[:200]}...")
         return {}
 
 
@@ -193,7 +212,7 @@ async def generate_styled_lesson(
     base_text: Optional[str] = None
 ) -> Dict[str, Any]:
     """Public entry point for the LangGraph workflow."""
-    initial_state = {
+    initial_state: GraphState = {
         "topic": topic,
         "grade": grade,
         "tiers": tiers,
@@ -202,11 +221,23 @@ async def generate_styled_lesson(
         "learning_style": learning_style,
         "generated_content": None,
         "iterations": 0,
-        "error": None
     }
-    
+
+    # Fast path: the style is already known, so the classifier/validator
+    # orchestration adds nothing — call the generator node directly and skip
+    # LangGraph's per-node state copies. The full graph stays available behind
+    # the flag for observability/debugging.
+    if os.getenv("EDUVISION_FAST_PATH", "1") == "1":
+        node = _NODES[route_by_style(initial_state)]
+        result = await node(initial_state)
+        content = result.get("generated_content")
+        if not content or "tiers" not in content:
+            raise ValueError("LangGraph generation failed: Invalid JSON structure")
+        return content
+
     result = await app.ainvoke(initial_state)
-    if result.get("error"):
-        raise ValueError(f"LangGraph generation failed: {result['error']}")
-    
-    return result["generated_content"]
+    content = result.get("generated_content")
+    if not content or "tiers" not in content:
+        raise ValueError("LangGraph generation failed: Invalid JSON structure")
+
+    return content
@@ -7,6 +7,7 @@ Replaces Auth0 entirely — zero external dependencies other than Postgres.
 import os
 import uuid
 import psycopg2
+from dotenv import load_dotenv
 from psycopg2.extras import RealDictCursor
 from datetime import datetime, timedelta
 from typing import Optional
@@ -16,23 +17,21 @@ from loguru import logger
 
 # ─── Config ───────────────────────────────────────────────────────────────────
 
+load_dotenv()
+
 SECRET_KEY = os.getenv("APP_SECRET_KEY", "eduvision-dev-secret-change-in-prod")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
+# Resolved once at import — re-parsing .env per connection was pure overhead
+_DATABASE_URL = (os.getenv("DATABASE_URL") or "").strip("'").strip('"')
+
 # ─── DB Init ──────────────────────────────────────────────────────────────────
 
 def _get_conn():
-    from dotenv import load_dotenv
-    load_dotenv()
-    db_url = os.getenv("DATABASE_URL")
-    if db_url:
-        db_url = db_url.strip("'").strip('"')
-        
-    if not db_url:
+    if not _DATABASE_URL:
         raise RuntimeError("DATABASE_URL environment variable is not set")
-    conn = psycopg2.connect(db_url)
-    return conn
+    return psycopg2.connect(_DATABASE_URL)
 
 
 def init_db():
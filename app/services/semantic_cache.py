@@ -0,0 +1,124 @@
+"""
+Two-level cache for lesson generation requests.
+
+Level 1 (exact): normalized request tuple → content, O(1) dict lookup.
+Level 2 (semantic): embeds the request and searches a FAISS index for a
+near-duplicate prior request (cosine similarity), so "photosynthesis, grade 7"
+and "photosynthesis for 7th graders" share one Gemini run.
+
+FAISS is optional — if faiss/numpy are missing the cache degrades gracefully
+to exact-match only.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Optional, Any, Dict
+
+from loguru import logger
+from app.config import get_settings
+
+try:
+    import faiss
+    import numpy as np
+    _FAISS_AVAILABLE = True
+except ImportError:  # pragma: no cover — optional dependency
+    faiss = None
+    np = None
+    _FAISS_AVAILABLE = False
+    logger.warning("[SemanticCache] faiss/numpy not installed — exact-match cache only")
+
+settings = get_settings()
+
+_EMBED_MODEL = "text-embedding-004"
+_EMBED_DIM = 768
+_SIMILARITY_THRESHOLD = 0.95
+_MAX_ENTRIES = 512
+
+# ─── Level 1: exact cache ────────────────────────────────────────────────────
+
+_exact_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+# ─── Level 2: FAISS index + parallel content list ────────────────────────────
+
+_index = faiss.IndexFlatIP(_EMBED_DIM) if _FAISS_AVAILABLE else None
+_indexed_content: list = []
+_lock = asyncio.Lock()
+
+
+def _make_key(topic: str, grade: str, tiers: int, language: str, learning_style: str) -> tuple:
+    return (topic.strip().lower(), grade.strip().lower(), tiers, language.strip().lower(), learning_style)
+
+
+def _request_text(key: tuple) -> str:
+    return f"topic: {key[0]} | grade: {key[1]} | tiers: {key[2]} | language: {key[3]} | style: {key[4]}"
+
+
+async def _embed(text: str) -> Optional["np.ndarray"]:
+    """Embeds the request text via the Gemini OpenAI-compatible endpoint, L2-normalized for cosine/IP search."""
+    from app.services.gemini import _client
+    try:
+        resp = await _client.embeddings.create(model=_EMBED_MODEL, input=text)
+        vec = np.asarray(resp.data[0].embedding, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(vec)
+        return vec
+    except Exception as e:
+        logger.warning(f"[SemanticCache] Embedding failed, skipping semantic lookup: {e}")
+        return None
+
+
+async def lookup(
+    topic: str,
+    grade: str,
+    tiers: int,
+    language: str,
+    learning_style: str = "none",
+) -> Optional[Dict[str, Any]]:
+    """Returns cached lesson content on an exact or near-duplicate hit, else None."""
+    key = _make_key(topic, grade, tiers, language, learning_style)
+
+    hit = _exact_cache.get(key)
+    if hit is not None:
+        _exact_cache.move_to_end(key)
+        logger.info(f"[SemanticCache] Exact hit: {key[0]}")
+        return hit
+
+    if not _FAISS_AVAILABLE or _index.ntotal == 0:
+        return None
+
+    vec = await _embed(_request_text(key))
+    if vec is None:
+        return None
+
+    scores, ids = _index.search(vec, 1)
+    if scores[0][0] >= _SIMILARITY_THRESHOLD:
+        logger.info(f"[SemanticCache] Semantic hit ({scores[0][0]:.3f}): {key[0]}")
+        return _indexed_content[ids[0][0]]
+    return None
+
+
+async def store(
+    topic: str,
+    grade: str,
+    tiers: int,
+    language: str,
+    content: Dict[str, Any],
+    learning_style: str = "none",
+) -> None:
+    """Records generated content under both the exact key and the FAISS index."""
+    key = _make_key(topic, grade, tiers, language, learning_style)
+
+    async with _lock:
+        _exact_cache[key] = content
+        _exact_cache.move_to_end(key)
+        while len(_exact_cache) > _MAX_ENTRIES:
+            _exact_cache.popitem(last=False)
+
+    if not _FAISS_AVAILABLE:
+        return
+
+    vec = await _embed(_request_text(key))
+    if vec is None:
+        return
+    async with _lock:
+        _index.add(vec)
+        _indexed_content.append(content)
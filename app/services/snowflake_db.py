@@ -3,14 +3,25 @@ Snowflake connector and CRUD helpers.
 Uses snowflake-connector-python with async-safe thread executor pattern.
 """
 
+import os
+import time
 import uuid
-import json
+import gzip
+import queue
+import atexit
 import asyncio
+import tempfile
 from typing import Optional, Any
-from datetime import datetime, timezone
-from functools import partial
-
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import snowflake.connector
+from cachetools import TTLCache
+
+# qmark → server-side binding: parameters (including large JSON payloads) ship
+# as binds instead of being escaped and interpolated into the SQL text client-
+# side, so the statement text stays constant and the server parses JSON once.
+snowflake.connector.paramstyle = "qmark"
 from loguru import logger
 from app.config import get_settings
 
@@ -18,36 +29,155 @@ settings = get_settings()
 
 # ─── Connection ───────────────────────────────────────────────────────────────
 
+# Connect kwargs hoisted from settings once — pydantic attribute access isn't
+# free, and these never change after import.
+_SF_CONNECT_KW = dict(
+    account=settings.snowflake_account,
+    user=settings.snowflake_user,
+    password=settings.snowflake_password,
+    database=settings.snowflake_database,
+    schema=settings.snowflake_schema,
+    warehouse=settings.snowflake_warehouse,
+    role=settings.snowflake_role,
+    session_parameters={
+        "QUERY_TAG": "eduvision-backend",
+        # Keep pooled sessions alive across idle periods instead of
+        # re-authenticating after the 4h token expiry.
+        "CLIENT_SESSION_KEEP_ALIVE": True,
+        # Overlap result-chunk downloads with Python-side row processing.
+        "CLIENT_PREFETCH_THREADS": 4,
+    },
+)
+
+
 def _get_connection():
-    return snowflake.connector.connect(
-        account=settings.snowflake_account,
-        user=settings.snowflake_user,
-        password=settings.snowflake_password,
-        database=settings.snowflake_database,
-        schema=settings.snowflake_schema,
-        warehouse=settings.snowflake_warehouse,
-        role=settings.snowflake_role,
-        session_parameters={"QUERY_TAG": "eduvision-backend"},
-    )
+    return snowflake.connector.connect(**_SF_CONNECT_KW)
+
+
+# Bounded pool of live connections — Snowflake auth + TLS setup dominates the
+# latency of the small point queries below, so sessions are reused instead of
+# reconnecting per call. Connections idle past the health interval get a
+# SELECT 1 probe on checkout and are replaced if dead.
+_POOL_SIZE = settings.snowflake_pool_size
+_HEALTH_CHECK_INTERVAL = 300  # seconds
+_pool: "queue.Queue[tuple]" = queue.Queue(maxsize=_POOL_SIZE)
+
+
+def _checkout():
+    while True:
+        try:
+            conn, last_ok = _pool.get_nowait()
+        except queue.Empty:
+            return _get_connection()
+        if conn.is_closed():
+            continue
+        if time.monotonic() - last_ok > _HEALTH_CHECK_INTERVAL:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+            except Exception:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                continue
+        return conn
+
+
+def _checkin(conn):
+    try:
+        _pool.put_nowait((conn, time.monotonic()))
+    except queue.Full:
+        conn.close()
+
+
+@contextmanager
+def _pooled_connection():
+    conn = _checkout()
+    try:
+        yield conn
+    except Exception:
+        # A failed query may leave the session in an unknown state — drop it.
+        try:
+            conn.close()
+        except Exception:
+            pass
+        raise
+    else:
+        _checkin(conn)
+
 
+def close_pool():
+    """Shutdown hook — closes all pooled connections."""
+    while True:
+        try:
+            conn, _ = _pool.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            conn.close()
+        except Exception:
+            pass
 
-def _run_sync(fn, *args, **kwargs):
-    """Run a sync Snowflake operation (blocking) in threadpool."""
-    return asyncio.get_event_loop().run_in_executor(None, partial(fn, *args, **kwargs))
 
+# Dedicated worker pool, sized to the connection pool — the default executor
+# spawns cpu_count()×5 threads lazily and pays creation cost on cold workers.
+_EXECUTOR = ThreadPoolExecutor(max_workers=_POOL_SIZE, thread_name_prefix="sf-db")
+atexit.register(_EXECUTOR.shutdown, wait=True)
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+
+def _run_sync(fn, *args):
+    """Run a sync Snowflake operation (blocking) in the dedicated threadpool.
+    Bounded to the pool size, so blocking calls can never outnumber
+    connections. Positional args go straight to run_in_executor — no partial
+    allocation on the per-query hot path."""
+    return asyncio.get_running_loop().run_in_executor(_EXECUTOR, fn, *args)
+
+
+def _dumps(obj) -> str:
+    """orjson encode → str (PARSE_JSON binds want text); ~3-5x faster than stdlib json."""
+    return orjson.dumps(obj).decode()
+
+
+_loads = orjson.loads
+
+
+def _variant(value):
+    """Decodes a VARIANT column exactly once — the connector may hand back either an already-parsed object or its JSON text, depending on version/settings."""
+    if isinstance(value, (dict, list)) or value is None:
+        return value
+    try:
+        return _loads(value)
+    except (orjson.JSONDecodeError, TypeError):
+        return value
+
+
+# Read-mostly TTL caches — get_user sits on nearly every request path and user
+# rows change rarely, so hot lookups become memory reads. Writers invalidate
+# their key; the short TTL bounds staleness for multi-worker deployments.
+_USER_CACHE = TTLCache(maxsize=10_000, ttl=60)
+_LESSON_CACHE = TTLCache(maxsize=2_000, ttl=60)
 
 
 # ─── Generic helpers ──────────────────────────────────────────────────────────
 
+def _cursor(conn):
+    """Reusable cursor cached on the pooled connection — checkout is exclusive,
+    so sharing is safe, and execute() resets cursor state anyway. Skips a
+    cursor allocation plus two context-manager frames on every call."""
+    cur = getattr(conn, "_sf_cursor", None)
+    if cur is None or cur.is_closed():
+        cur = conn.cursor()
+        conn._sf_cursor = cur
+    return cur
+
+
 def _execute(sql: str, params: tuple = (), fetch: bool = False) -> Optional[list]:
-    with _get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, params)
-            if fetch:
-                return cur.fetchall()
+    with _pooled_connection() as conn:
+        cur = _cursor(conn)
+        cur.execute(sql, params)
+        if fetch:
+            return cur.fetchall()
     return None
 
 
@@ -55,6 +185,140 @@ async def execute(sql: str, params: tuple = (), fetch: bool = False):
     return await _run_sync(_execute, sql, params, fetch)
 
 
+def _execute_one(sql: str, params: tuple = ()) -> Optional[tuple]:
+    """Point-read variant — fetchone() skips the full result-batch materialization that fetchall() pays even for single-row lookups."""
+    with _pooled_connection() as conn:
+        cur = _cursor(conn)
+        cur.execute(sql, params)
+        return cur.fetchone()
+
+
+async def execute_one(sql: str, params: tuple = ()):
+    return await _run_sync(_execute_one, sql, params)
+
+
+def _execute_multi(sqls: list, params: tuple = ()) -> list:
+    """Runs several statements in one Snowflake round-trip and returns a list of result sets (one per statement, in order)."""
+    multi_sql = ";\n".join(sqls)
+    with _pooled_connection() as conn:
+        cur = _cursor(conn)
+        cur.execute(multi_sql, params, num_statements=len(sqls))
+        results = [cur.fetchall()]
+        while cur.nextset():
+            results.append(cur.fetchall())
+    return results
+
+
+async def execute_multi(sqls: list, params: tuple = ()):
+    return await _run_sync(_execute_multi, sqls, params)
+
+
+async def ensure_tables(specs: dict):
+    """Creates any tables from ``{name: create_ddl}`` that don't exist yet.
+
+    One INFORMATION_SCHEMA read replaces a CREATE ... IF NOT EXISTS compile
+    per table, so already-initialized environments pay a single cheap SELECT.
+    """
+    rows = await execute(
+        "SELECT table_name FROM INFORMATION_SCHEMA.TABLES WHERE table_schema = CURRENT_SCHEMA()",
+        fetch=True,
+    )
+    existing = {r[0].lower() for r in rows}
+    missing = [ddl for name, ddl in specs.items() if name.lower() not in existing]
+    if len(missing) == 1:
+        await execute(missing[0])
+    elif missing:
+        await execute_multi(missing)
+    return len(missing)
+
+
+# Native async query path — submits with execute_async and lets the event loop
+# poll for completion, so a long analytics query does not pin a worker thread
+# for its whole runtime (threads are only borrowed for the short HTTP hops).
+
+def _submit_async(sql: str, params: tuple):
+    conn = _checkout()
+    try:
+        with conn.cursor() as cur:
+            cur.execute_async(sql, params)
+            return conn, cur.sfqid
+    except Exception:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        raise
+
+
+def _is_still_running(conn, sfqid: str) -> bool:
+    return conn.is_still_running(conn.get_query_status(sfqid))
+
+
+def _collect_results(conn, sfqid: str) -> list:
+    with conn.cursor() as cur:
+        cur.get_results_from_sfqid(sfqid)
+        return cur.fetchall()
+
+
+async def execute_async_query(sql: str, params: tuple = ()) -> list:
+    """Runs a (typically long) query without holding an executor thread while Snowflake computes."""
+    conn, sfqid = await _run_sync(_submit_async, sql, params)
+    try:
+        while await _run_sync(_is_still_running, conn, sfqid):
+            await asyncio.sleep(0.1)
+        rows = await _run_sync(_collect_results, conn, sfqid)
+    except Exception:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        raise
+    _checkin(conn)
+    return rows
+
+
+_STREAM_BATCH_SIZE = 1000
+_STREAM_DONE = object()
+
+
+async def execute_stream(sql: str, params: tuple = (), batch_size: int = _STREAM_BATCH_SIZE):
+    """
+    Async generator over result rows, fetched in batches — large scans never
+    hold the whole result set in memory the way fetchall() does. Batches are
+    bridged from the executor thread through an asyncio queue.
+    """
+    loop = asyncio.get_running_loop()
+    q: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+    def _producer():
+        try:
+            with _pooled_connection() as conn:
+                cur = _cursor(conn)
+                cur.execute(sql, params)
+                while True:
+                    batch = cur.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    asyncio.run_coroutine_threadsafe(q.put(batch), loop).result()
+        except Exception as e:
+            asyncio.run_coroutine_threadsafe(q.put(e), loop).result()
+            return
+        asyncio.run_coroutine_threadsafe(q.put(_STREAM_DONE), loop).result()
+
+    producer = loop.run_in_executor(_EXECUTOR, _producer)
+    try:
+        while True:
+            item = await q.get()
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            for row in item:
+                yield row
+    finally:
+        await producer
+
+
 # ─── Users ────────────────────────────────────────────────────────────────────
 
 async def upsert_user(
@@ -69,10 +333,10 @@ async def upsert_user(
     name: Optional[str] = None,
     email: Optional[str] = None,
 ):
-    profile_json = json.dumps(accessibility_profile or {})
+    profile_json = _dumps(accessibility_profile or {})
     sql = """
         MERGE INTO users AS target
-        USING (SELECT %s AS user_id, %s AS role, %s AS school_id, PARSE_JSON(%s) AS accessibility_profile_json, %s AS sub_role, %s AS disability_type, %s AS learning_style, %s AS onboarding_complete, %s AS name, %s AS email) AS src
+        USING (SELECT ? AS user_id, ? AS role, ? AS school_id, PARSE_JSON(?) AS accessibility_profile_json, ? AS sub_role, ? AS disability_type, ? AS learning_style, ? AS onboarding_complete, ? AS name, ? AS email) AS src
         ON target.user_id = src.user_id
         WHEN MATCHED THEN UPDATE SET
             role = src.role,
@@ -88,57 +352,64 @@ async def upsert_user(
             VALUES (src.user_id, src.role, src.school_id, src.accessibility_profile_json, src.sub_role, src.disability_type, src.learning_style, src.onboarding_complete, src.name, src.email, CURRENT_TIMESTAMP)
     """
     await execute(sql, (user_id, role, school_id, profile_json, sub_role, disability_type, learning_style, onboarding_complete, name, email))
+    _USER_CACHE.pop(user_id, None)
     logger.info(f"[Snowflake] upsert_user: {user_id}")
 
 
+# Row keys as module tuples: dict(zip(...)) materializes rows in C instead of
+# evaluating an indexed dict literal per row — noticeable on large list results.
+_USER_KEYS = ("user_id", "role", "school_id", "accessibility_profile_json", "sub_role", "disability_type", "learning_style", "onboarding_complete", "name", "email")
+_STUDENT_KEYS = ("user_id", "role", "sub_role", "disability_type", "learning_style", "onboarding_complete", "accessibility_profile_json", "name", "email")
+_LESSON_SUMMARY_KEYS = ("lesson_id", "topic", "grade", "tiers", "created_at")
+
+# Hot SQL is pinned as module constants so repeated calls reuse the identical
+# statement text (server-side statement cache keys on it) instead of rebuilding.
+_SQL_GET_USER = "SELECT user_id, role, school_id, accessibility_profile_json, sub_role, disability_type, learning_style, onboarding_complete, name, email FROM users WHERE user_id = ?"
+
+
 async def get_user(user_id: str) -> Optional[dict]:
-    rows = await execute(
-        "SELECT user_id, role, school_id, accessibility_profile_json, sub_role, disability_type, learning_style, onboarding_complete, name, email FROM users WHERE user_id = %s",
-        (user_id,),
-        fetch=True,
-    )
-    if not rows:
+    cached = _USER_CACHE.get(user_id)
+    if cached is not None:
+        return cached
+    r = await execute_one(_SQL_GET_USER, (user_id,))
+    if not r:
         return None
-    r = rows[0]
-    return {
-        "user_id": r[0], "role": r[1], "school_id": r[2], 
-        "accessibility_profile_json": r[3], "sub_role": r[4], 
-        "disability_type": r[5], "learning_style": r[6], 
-        "onboarding_complete": bool(r[7]) if r[7] is not None else False,
-        "name": r[8], "email": r[9]
-    }
+    user = dict(zip(_USER_KEYS, r))
+    user["onboarding_complete"] = bool(user["onboarding_complete"]) if user["onboarding_complete"] is not None else False
+    _USER_CACHE[user_id] = user
+    return user
 async def delete_user(user_id: str):
-    await execute("DELETE FROM users WHERE user_id = %s", (user_id,))
+    await execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+    _USER_CACHE.pop(user_id, None)
     logger.info(f"[Snowflake] delete_user: {user_id}")
 
 async def complete_onboarding(user_id: str, sub_role: str, disability_type: Optional[str], learning_style: Optional[str], accessibility_profile: Optional[dict]):
-    profile_json = json.dumps(accessibility_profile or {})
+    profile_json = _dumps(accessibility_profile or {})
     sql = """
         UPDATE users SET
-            sub_role = %s,
-            disability_type = %s,
-            learning_style = %s,
-            accessibility_profile_json = PARSE_JSON(%s),
+            sub_role = ?,
+            disability_type = ?,
+            learning_style = ?,
+            accessibility_profile_json = PARSE_JSON(?),
             onboarding_complete = TRUE
-        WHERE user_id = %s
+        WHERE user_id = ?
     """
     await execute(sql, (sub_role, disability_type, learning_style, profile_json, user_id))
+    _USER_CACHE.pop(user_id, None)
     logger.info(f"[Snowflake] complete_onboarding for {user_id}")
 
 async def list_students_by_school(school_id: str) -> list:
-    rows = await execute(
-        "SELECT user_id, role, sub_role, disability_type, learning_style, onboarding_complete, accessibility_profile_json, name, email FROM users WHERE school_id = %s",
+    # Unbounded scan (every user in the school) — stream batches instead of one
+    # fetchall so a large roster never materializes twice (raw rows + dicts).
+    students = []
+    async for r in execute_stream(
+        "SELECT user_id, role, sub_role, disability_type, learning_style, onboarding_complete, accessibility_profile_json, name, email FROM users WHERE school_id = ?",
         (school_id,),
-        fetch=True,
-    )
-    return [
-       {
-           "user_id": r[0], "role": r[1], "sub_role": r[2],
-           "disability_type": r[3], "learning_style": r[4],
-           "onboarding_complete": bool(r[5]) if r[5] is not None else False,
-           "accessibility_profile_json": r[6], "name": r[7], "email": r[8]
-       } for r in (rows or [])
-    ]
+    ):
+        s = dict(zip(_STUDENT_KEYS, r))
+        s["onboarding_complete"] = bool(s["onboarding_complete"]) if s["onboarding_complete"] is not None else False
+        students.append(s)
+    return students
 
 
 # ─── Lessons ──────────────────────────────────────────────────────────────────
@@ -153,48 +424,54 @@ async def insert_lesson(
 ) -> str:
     sql = """
         INSERT INTO lessons (lesson_id, teacher_id, topic, grade, tiers, content_json, created_at)
-        SELECT %s, %s, %s, %s, %s, PARSE_JSON(%s), CURRENT_TIMESTAMP
+        SELECT ?, ?, ?, ?, ?, PARSE_JSON(?), CURRENT_TIMESTAMP
     """
-    await execute(sql, (lesson_id, teacher_id, topic, grade, tiers, json.dumps(content_json)))
+    await execute(sql, (lesson_id, teacher_id, topic, grade, tiers, _dumps(content_json)))
     logger.info(f"[Snowflake] insert_lesson: {lesson_id}")
     return lesson_id
 
 
+_SQL_GET_LESSON = "SELECT lesson_id, teacher_id, topic, grade, tiers, content_json, created_at FROM lessons WHERE lesson_id = ?"
+
+
 async def get_lesson(lesson_id: str) -> Optional[dict]:
-    rows = await execute(
-        "SELECT lesson_id, teacher_id, topic, grade, tiers, content_json, created_at FROM lessons WHERE lesson_id = %s",
-        (lesson_id,),
-        fetch=True,
-    )
-    if not rows:
+    cached = _LESSON_CACHE.get(lesson_id)
+    if cached is not None:
+        return cached
+    r = await execute_one(_SQL_GET_LESSON, (lesson_id,))
+    if not r:
         return None
-    r = rows[0]
-    return {
+    lesson = {
         "lesson_id": r[0], "teacher_id": r[1], "topic": r[2],
-        "grade": r[3], "tiers": r[4], "content_json": r[5], "created_at": str(r[6]),
+        "grade": r[3], "tiers": r[4], "content_json": _variant(r[5]), "created_at": str(r[6]),
     }
+    _LESSON_CACHE[lesson_id] = lesson
+    return lesson
 
 
 async def update_lesson(lesson_id: str, content_json: dict):
     sql = """
         UPDATE lessons
-        SET content_json = PARSE_JSON(%s)
-        WHERE lesson_id = %s
+        SET content_json = PARSE_JSON(?)
+        WHERE lesson_id = ?
     """
-    await execute(sql, (json.dumps(content_json), lesson_id))
+    await execute(sql, (_dumps(content_json), lesson_id))
+    _LESSON_CACHE.pop(lesson_id, None)
     logger.info(f"[Snowflake] update_lesson: {lesson_id}")
 
 
 async def list_lessons_by_teacher(teacher_id: str) -> list:
-    rows = await execute(
-        "SELECT lesson_id, topic, grade, tiers, created_at FROM lessons WHERE teacher_id = %s ORDER BY created_at DESC",
+    # Unbounded per-teacher history — stream batches so memory stays O(batch)
+    # rather than O(rows) while the dicts are built.
+    lessons = []
+    async for r in execute_stream(
+        # TO_VARCHAR server-side: the connector skips datetime construction
+        # and the per-row str() conversion goes away.
+        "SELECT lesson_id, topic, grade, tiers, TO_VARCHAR(created_at, 'YYYY-MM-DD HH24:MI:SS') FROM lessons WHERE teacher_id = ? ORDER BY created_at DESC",
         (teacher_id,),
-        fetch=True,
-    )
-    return [
-        {"lesson_id": r[0], "topic": r[1], "grade": r[2], "tiers": r[3], "created_at": str(r[4])}
-        for r in (rows or [])
-    ]
+    ):
+        lessons.append(dict(zip(_LESSON_SUMMARY_KEYS, r)))
+    return lessons
 
 # ─── Tests ────────────────────────────────────────────────────────────
 
@@ -209,30 +486,21 @@ async def create_test(
 ):
     sql = """
         INSERT INTO tests (test_id, teacher_id, title, topic, grade, time_limit, questions, created_at)
-        VALUES (%s, %s, %s, %s, %s, %s, PARSE_JSON(%s), CURRENT_TIMESTAMP)
+        VALUES (?, ?, ?, ?, ?, ?, PARSE_JSON(?), CURRENT_TIMESTAMP)
     """
-    await execute(sql, (test_id, teacher_id, title, topic, grade, time_limit, json.dumps(questions)))
+    await execute(sql, (test_id, teacher_id, title, topic, grade, time_limit, _dumps(questions)))
     logger.info(f"[Snowflake] create_test: {test_id}")
     return test_id
 
 
+_SQL_GET_TEST = "SELECT test_id, teacher_id, title, topic, grade, time_limit, questions, created_at FROM tests WHERE test_id = ?"
+
+
 async def get_test(test_id: str) -> Optional[dict]:
-    rows = await execute(
-        "SELECT test_id, teacher_id, title, topic, grade, time_limit, questions, created_at FROM tests WHERE test_id = %s",
-        (test_id,),
-        fetch=True,
-    )
-    if not rows:
+    r = await execute_one(_SQL_GET_TEST, (test_id,))
+    if not r:
         return None
-    r = rows[0]
-    
-    q_data = r[6]
-    if isinstance(q_data, str):
-        try:
-            q_data = json.loads(q_data)
-        except json.JSONDecodeError:
-            pass
-            
+    q_data = _variant(r[6])
     return {
         "test_id": r[0],
         "teacher_id": r[1],
@@ -258,21 +526,60 @@ async def create_assignment(
 ) -> str:
     sql = """
         INSERT INTO assignments (assignment_id, lesson_id, test_id, type, teacher_id, assigned_to, due_date, status, created_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, 'pending', CURRENT_TIMESTAMP)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', CURRENT_TIMESTAMP)
     """
     await execute(sql, (assignment_id, lesson_id, test_id, assignment_type, teacher_id, assigned_to, due_date))
     logger.info(f"[Snowflake] create_assignment: {assignment_id} (type: {assignment_type})")
     return assignment_id
 
 
+async def create_assignments_bulk(assignments: list) -> list:
+    """
+    Inserts many assignments in one statement — assigning a lesson/test to a
+    whole class costs a single round-trip instead of one INSERT per student.
+    Each dict takes the same keys as create_assignment; missing assignment_ids
+    are generated. Returns the list of assignment_ids.
+    """
+    if not assignments:
+        return []
+    sql = """
+        INSERT INTO assignments (assignment_id, lesson_id, test_id, type, teacher_id, assigned_to, due_date, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', CURRENT_TIMESTAMP)
+    """
+    params_list = []
+    ids = []
+    for a in assignments:
+        assignment_id = a.get("assignment_id") or str(uuid.uuid4())
+        ids.append(assignment_id)
+        params_list.append((
+            assignment_id,
+            a.get("lesson_id"),
+            a.get("test_id"),
+            a.get("assignment_type", "lesson"),
+            a["teacher_id"],
+            a["assigned_to"],
+            a.get("due_date"),
+        ))
+
+    def _bulk_insert():
+        with _pooled_connection() as conn:
+            with conn.cursor() as cur:
+                # executemany rewrites simple VALUES inserts into one multi-row statement
+                cur.executemany(sql, params_list)
+
+    await _run_sync(_bulk_insert)
+    logger.info(f"[Snowflake] create_assignments_bulk: {len(ids)} assignments")
+    return ids
+
+
 async def get_student_assignments(assigned_to: str) -> list:
     # We use LEFT JOINs to fetch either lesson or test info depending on the type
     sql = """
-        SELECT a.assignment_id, a.lesson_id, a.test_id, a.type, a.teacher_id, a.assigned_to, a.due_date, a.status, a.created_at, l.topic, l.grade, t.topic as test_topic, t.grade as test_grade, t.title as test_title
+        SELECT a.assignment_id, a.lesson_id, a.test_id, a.type, a.teacher_id, a.assigned_to, a.due_date, a.status, TO_VARCHAR(a.created_at, 'YYYY-MM-DD HH24:MI:SS') AS created_at, l.topic, l.grade, t.topic as test_topic, t.grade as test_grade, t.title as test_title
         FROM assignments a
         LEFT JOIN lessons l ON a.lesson_id = l.lesson_id
         LEFT JOIN tests t ON a.test_id = t.test_id
-        WHERE a.assigned_to = %s OR a.assigned_to = 'class'
+        WHERE a.assigned_to IN (?, 'class')
         ORDER BY a.created_at DESC
     """
     rows = await execute(sql, (assigned_to,), fetch=True)
@@ -286,7 +593,7 @@ async def get_student_assignments(assigned_to: str) -> list:
             "assigned_to": r[5],
             "due_date": r[6],
             "status": r[7],
-            "created_at": str(r[8]),
+            "created_at": r[8],
             "topic": r[9] if r[3] == 'lesson' else r[11],
             "grade": r[10] if r[3] == 'lesson' else r[12],
             "title": r[13] if r[3] == 'test' else None
@@ -299,9 +606,9 @@ async def submit_assignment(assignment_id: str, student_response: Optional[str]
     sql = """
         UPDATE assignments
         SET status = 'submitted',
-            student_response = COALESCE(%s, student_response),
-            raw_score = COALESCE(%s, raw_score)
-        WHERE assignment_id = %s
+            student_response = COALESCE(?, student_response),
+            raw_score = COALESCE(?, raw_score)
+        WHERE assignment_id = ?
     """
     await execute(sql, (student_response, raw_score, assignment_id))
     logger.info(f"[Snowflake] submit_assignment: {assignment_id} (score={raw_score})")
@@ -309,21 +616,22 @@ async def submit_assignment(assignment_id: str, student_response: Optional[str]
 
 # ─── Lesson Assets ────────────────────────────────────────────────────────────
 
+_SQL_INSERT_LESSON_ASSET = """
+    INSERT INTO lesson_assets (lesson_id, level, audio_url, pdf_url, checksum, created_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+
 async def insert_lesson_asset(lesson_id: str, level: int, audio_url: str, pdf_url: str = "", checksum: str = ""):
-    sql = """
-        INSERT INTO lesson_assets (lesson_id, level, audio_url, pdf_url, checksum, created_at)
-        VALUES (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-    """
-    await execute(sql, (lesson_id, level, audio_url, pdf_url, checksum))
+    await _buffered_write("lesson_assets", (lesson_id, level, audio_url, pdf_url, checksum))
 
 
 async def get_lesson_audio(lesson_id: str, level: int) -> Optional[str]:
-    rows = await execute(
-        "SELECT audio_url FROM lesson_assets WHERE lesson_id = %s AND level = %s",
+    row = await execute_one(
+        "SELECT audio_url FROM lesson_assets WHERE lesson_id = ? AND level = ?",
         (lesson_id, level),
-        fetch=True,
     )
-    return rows[0][0] if rows else None
+    return row[0] if row else None
 
 
 # ─── Practice Sessions ────────────────────────────────────────────────────────
@@ -337,31 +645,29 @@ async def create_session(
 ):
     sql = """
         INSERT INTO practice_sessions (session_id, student_id, lesson_id, mode, accessibility_mode_json, started_at)
-        SELECT %s, %s, %s, %s, PARSE_JSON(%s), CURRENT_TIMESTAMP
+        SELECT ?, ?, ?, ?, PARSE_JSON(?), CURRENT_TIMESTAMP
     """
-    await execute(sql, (session_id, student_id, lesson_id, mode, json.dumps(accessibility_json)))
+    await execute(sql, (session_id, student_id, lesson_id, mode, _dumps(accessibility_json)))
     logger.info(f"[Snowflake] create_session: {session_id}")
 
 
 async def end_session(session_id: str):
     await execute(
-        "UPDATE practice_sessions SET ended_at = CURRENT_TIMESTAMP WHERE session_id = %s",
+        "UPDATE practice_sessions SET ended_at = CURRENT_TIMESTAMP WHERE session_id = ?",
         (session_id,),
     )
 
 
+_SQL_GET_SESSION = "SELECT session_id, student_id, lesson_id, mode, accessibility_mode_json, started_at, ended_at FROM practice_sessions WHERE session_id = ?"
+
+
 async def get_session(session_id: str) -> Optional[dict]:
-    rows = await execute(
-        "SELECT session_id, student_id, lesson_id, mode, accessibility_mode_json, started_at, ended_at FROM practice_sessions WHERE session_id = %s",
-        (session_id,),
-        fetch=True,
-    )
-    if not rows:
+    r = await execute_one(_SQL_GET_SESSION, (session_id,))
+    if not r:
         return None
-    r = rows[0]
     return {
         "session_id": r[0], "student_id": r[1], "lesson_id": r[2],
-        "mode": r[3], "accessibility_mode_json": r[4],
+        "mode": r[3], "accessibility_mode_json": _variant(r[4]),
         "started_at": str(r[5]), "ended_at": str(r[6]) if r[6] else None,
     }
 
@@ -376,31 +682,134 @@ async def save_artifact(
     scores_json: dict,
 ):
     sql = """
-        INSERT INTO practice_artifacts (session_id, audio_url, transcript_text, feedback_json, scores_json)
-        SELECT %s, %s, %s, PARSE_JSON(%s), PARSE_JSON(%s)
+        INSERT INTO practice_artifacts (session_id, audio_url, transcript_text, feedback_json, scores_json, fluency_score, grammar_score, confidence_score)
+        SELECT ?, ?, ?, PARSE_JSON(?), PARSE_JSON(?), ?, ?, ?
     """
-    await execute(sql, (session_id, audio_url, transcript_text, json.dumps(feedback_json), json.dumps(scores_json)))
+    # Scores land in typed columns at write time, so analytics aggregates never
+    # pay per-row VARIANT extraction.
+    await execute(sql, (
+        session_id,
+        audio_url,
+        transcript_text,
+        _dumps(feedback_json),
+        _dumps(scores_json),
+        scores_json.get("fluency"),
+        scores_json.get("grammar"),
+        scores_json.get("confidence"),
+    ))
     logger.info(f"[Snowflake] save_artifact: session={session_id}")
 
 
+_ARTIFACT_STAGE = "@~/eduvision_stage"
+
+
+def _bulk_copy_artifacts(rows: list) -> int:
+    """PUT a gzip-NDJSON file to the user stage and COPY it into
+    practice_artifacts — one round-trip per batch instead of per row."""
+    payload = b"\n".join(orjson.dumps(r) for r in rows)
+    fd, path = tempfile.mkstemp(suffix=".ndjson.gz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.compress(payload))
+        with _pooled_connection() as conn:
+            cur = _cursor(conn)
+            cur.execute(f"PUT file://{path} {_ARTIFACT_STAGE} AUTO_COMPRESS=FALSE OVERWRITE=TRUE")
+            cur.execute(
+                f"COPY INTO practice_artifacts FROM {_ARTIFACT_STAGE}/{os.path.basename(path)} "
+                "FILE_FORMAT=(TYPE=JSON COMPRESSION=GZIP) "
+                "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE PURGE=TRUE"
+            )
+    finally:
+        os.unlink(path)
+    return len(rows)
+
+
+async def bulk_save_artifacts(artifacts: list) -> int:
+    """
+    Bulk ingest path for mass artifact writes (class sessions, imports).
+    Stages the batch as one compressed file and COPYs it in, which beats
+    row-at-a-time INSERTs by an order of magnitude at volume.
+
+    Each item needs session_id, audio_url, transcript_text, feedback_json
+    and scores_json (dicts, not pre-serialized).
+    """
+    rows = []
+    for a in artifacts:
+        scores = a.get("scores_json") or {}
+        rows.append({
+            "session_id": a["session_id"],
+            "audio_url": a.get("audio_url"),
+            "transcript_text": a.get("transcript_text"),
+            "feedback_json": a.get("feedback_json") or {},
+            "scores_json": scores,
+            "fluency_score": scores.get("fluency"),
+            "grammar_score": scores.get("grammar"),
+            "confidence_score": scores.get("confidence"),
+        })
+    if not rows:
+        return 0
+    count = await _run_sync(_bulk_copy_artifacts, rows)
+    logger.info(f"[Snowflake] bulk_save_artifacts: {count} rows staged and copied")
+    return count
+
+
 # ─── Analytics ────────────────────────────────────────────────────────────────
 
+# Dashboard aggregates change on the minute scale but are queried per page
+# load — a short TTL bounds staleness while the multi-join AVGs become memory
+# reads. The per-key lock keeps a cache miss from fanning out into a
+# thundering herd of identical warehouse queries.
+_INSIGHTS_CACHE = TTLCache(maxsize=1024, ttl=60)
+_INSIGHTS_LOCKS: dict = {}
+
+
+async def _cached_analytics(key: tuple, fetch):
+    cached = _INSIGHTS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    lock = _INSIGHTS_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _INSIGHTS_CACHE.get(key)
+        if cached is not None:
+            return cached
+        result = await fetch()
+        _INSIGHTS_CACHE[key] = result
+        return result
+
+
+async def get_dashboard(teacher_id: str, class_id: Optional[str] = None) -> dict:
+    """Class insights and per-student progress in one await — both halves run
+    concurrently when cold and come straight from the analytics cache when
+    warm."""
+    insights, students = await asyncio.gather(
+        get_class_insights(teacher_id, class_id),
+        get_student_progress(teacher_id, class_id),
+    )
+    return {"insights": insights, "students": students}
+
+
 async def get_class_insights(teacher_id: str, class_id: Optional[str] = None) -> dict:
     """Returns aggregate metrics for a teacher's class from Snowflake."""
-    rows = await execute(
+    return await _cached_analytics(
+        ("insights", teacher_id, class_id),
+        lambda: _fetch_class_insights(teacher_id, class_id),
+    )
+
+
+async def _fetch_class_insights(teacher_id: str, class_id: Optional[str] = None) -> dict:
+    rows = await execute_async_query(
         """
         SELECT
             COUNT(ps.session_id) AS total_sessions,
-            AVG(pa.scores_json:fluency::FLOAT) AS avg_fluency,
-            AVG(pa.scores_json:grammar::FLOAT) AS avg_grammar,
-            AVG(pa.scores_json:confidence::FLOAT) AS avg_confidence
+            AVG(pa.fluency_score) AS avg_fluency,
+            AVG(pa.grammar_score) AS avg_grammar,
+            AVG(pa.confidence_score) AS avg_confidence
         FROM practice_sessions ps
         JOIN practice_artifacts pa ON ps.session_id = pa.session_id
         JOIN lessons l ON ps.lesson_id = l.lesson_id
-        WHERE l.teacher_id = %s
+        WHERE l.teacher_id = ?
         """,
         (teacher_id,),
-        fetch=True,
     )
     if not rows or not rows[0][0]:
         return {
@@ -428,39 +837,45 @@ async def get_class_insights(teacher_id: str, class_id: Optional[str] = None) ->
 
 
 async def get_student_progress(teacher_id: str, class_id: Optional[str] = None) -> list:
-    rows = await execute(
+    return await _cached_analytics(
+        ("progress", teacher_id, class_id),
+        lambda: _fetch_student_progress(teacher_id, class_id),
+    )
+
+
+async def _fetch_student_progress(teacher_id: str, class_id: Optional[str] = None) -> list:
+    rows = await execute_async_query(
         """
         SELECT
             u.user_id AS student_id,
             COUNT(ps.session_id) AS session_count,
-            AVG(pa.scores_json:fluency::FLOAT) AS avg_fluency,
-            AVG(pa.scores_json:grammar::FLOAT) AS avg_grammar,
-            AVG(pa.scores_json:confidence::FLOAT) AS avg_confidence,
-            MAX(ps.started_at) AS last_active,
-            u.disability_type,
-            u.learning_style,
+            AVG(pa.fluency_score) AS avg_fluency,
+            AVG(pa.grammar_score) AS avg_grammar,
+            AVG(pa.confidence_score) AS avg_confidence,
+            TO_VARCHAR(MAX(ps.started_at), 'YYYY-MM-DD HH24:MI:SS') AS last_active,
+            COALESCE(u.disability_type, u.learning_style, 'general') AS accessibility_mode,
             u.name
         FROM users u
         LEFT JOIN practice_sessions ps ON u.user_id = ps.student_id
         LEFT JOIN practice_artifacts pa ON ps.session_id = pa.session_id
-        LEFT JOIN lessons l ON ps.lesson_id = l.lesson_id AND l.teacher_id = %s
+        LEFT JOIN lessons l ON ps.lesson_id = l.lesson_id AND l.teacher_id = ?
         WHERE u.role = 'student'
         GROUP BY u.user_id, u.disability_type, u.learning_style, u.name
         ORDER BY last_active DESC NULLS LAST
         """,
         (teacher_id,),
-        fetch=True,
     )
     return [
         {
             "student_id": r[0],
-            "name": r[8],
+            "name": r[7],
             "session_count": int(r[1] or 0),
             "avg_fluency": round(float(r[2]), 2) if r[2] else None,
             "avg_grammar": round(float(r[3]), 2) if r[3] else None,
             "avg_confidence": round(float(r[4]), 2) if r[4] else None,
-            "last_active": str(r[5]) if r[5] else None,
-            "accessibility_modes_used": [r[6] or r[7] or "general"],
+            "last_active": r[5],
+            # COALESCE happens server-side — one string per row instead of two
+            "accessibility_modes_used": [r[6]],
         }
         for r in (rows or [])
     ]
@@ -468,103 +883,187 @@ async def get_student_progress(teacher_id: str, class_id: Optional[str] = None)
 
 # ─── Events ───────────────────────────────────────────────────────────────────
 
+# event_id comes from the column's DEFAULT UUID_STRING() — no per-event
+# uuid4() (and its urandom syscall) on the client, which matters when the
+# flusher pushes hundreds of rows per batch.
+_SQL_LOG_EVENT = """
+    INSERT INTO events (user_id, event_type, payload_json, session_id, lesson_id, ts)
+    SELECT ?, ?, PARSE_JSON(?), ?, ?, CURRENT_TIMESTAMP
+"""
+
+# Fire-and-forget writes (events, lesson assets) are buffered per table and
+# flushed as one executemany batch, so tiny single-row INSERTs don't saturate
+# the connection pool under load. save_artifact stays a direct write: student
+# work products shouldn't risk a silent drop on flush failure.
+_WRITE_SQL = {
+    "events": _SQL_LOG_EVENT,
+    "lesson_assets": _SQL_INSERT_LESSON_ASSET,
+}
+_WRITE_QUEUES: dict = {name: asyncio.Queue() for name in _WRITE_SQL}
+_FLUSH_INTERVAL = 0.25  # seconds
+_FLUSH_MAX_BATCH = 500
+_flusher_task: Optional[asyncio.Task] = None
+
+
+def _flush_batch(sql: str, batch: list):
+    with _pooled_connection() as conn:
+        _cursor(conn).executemany(sql, batch)
+
+
+async def _drain_and_flush():
+    for table, q in _WRITE_QUEUES.items():
+        batch = []
+        while len(batch) < _FLUSH_MAX_BATCH:
+            try:
+                batch.append(q.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if batch:
+            try:
+                await _run_sync(_flush_batch, _WRITE_SQL[table], batch)
+                logger.debug(f"[Snowflake] flushed {len(batch)} rows to {table}")
+            except Exception as e:
+                logger.error(f"[Snowflake] {table} flush failed ({len(batch)} rows dropped): {e}")
+
+
+async def _write_flusher():
+    while True:
+        await asyncio.sleep(_FLUSH_INTERVAL)
+        await _drain_and_flush()
+
+
+def start_event_flusher():
+    """Startup hook — begins the periodic buffered-write flush task."""
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.get_running_loop().create_task(_write_flusher())
+
+
+async def stop_event_flusher():
+    """Shutdown hook — cancels the flusher and writes out any buffered rows."""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        _flusher_task = None
+    await _drain_and_flush()
+
+
+async def _buffered_write(table: str, row: tuple):
+    if _flusher_task is not None and not _flusher_task.done():
+        _WRITE_QUEUES[table].put_nowait(row)
+    else:
+        # No flusher running (scripts, tests) — write through directly.
+        await execute(_WRITE_SQL[table], row)
+
+
 async def log_event(user_id: str, event_type: str, payload: dict):
-    event_id = str(uuid.uuid4())
-    sql = """
-        INSERT INTO events (event_id, user_id, event_type, payload_json, ts)
-        SELECT %s, %s, %s, PARSE_JSON(%s), CURRENT_TIMESTAMP
-    """
-    await execute(sql, (event_id, user_id, event_type, json.dumps(payload or {})))
+    payload = payload or {}
+    # session_id/lesson_id are the common payload keys — write them to the
+    # typed columns too so queries on them never open the VARIANT.
+    await _buffered_write("events", (
+        user_id,
+        event_type,
+        _dumps(payload),
+        payload.get("session_id"),
+        payload.get("lesson_id"),
+    ))
     logger.debug(f"[Snowflake] log_event: {event_type} for user={user_id}")
 
 
 async def get_student_stats(user_id: str) -> dict:
     """Calculate realistic student stats and gamification progress."""
     try:
-        # 1. Total Sessions & Trend (+X in last 7 days)
-        sql_sessions = """
-            SELECT 
-                COUNT(*) as total,
-                COUNT(CASE WHEN started_at >= DATEADD(day, -7, CURRENT_TIMESTAMP()) THEN 1 END) as recent
-            FROM practice_sessions 
-            WHERE student_id = %s
-        """
-        session_rows = await execute(sql_sessions, (user_id,), fetch=True)
-        total_sessions = session_rows[0][0] or 0
-        recent_sessions = session_rows[0][1] or 0
-        
-        # 2. Avg Fluency & Trend
-        sql_fluency = """
-            SELECT 
-                AVG(pa.scores_json:fluency::FLOAT) as avg_f,
-                AVG(CASE WHEN ps.started_at >= DATEADD(day, -7, CURRENT_TIMESTAMP()) THEN pa.scores_json:fluency::FLOAT END) as recent_f
-            FROM practice_artifacts pa
-            JOIN practice_sessions ps ON pa.session_id = ps.session_id
-            WHERE ps.student_id = %s
+        # 1+2+4. Sessions, fluency and submitted counts share the same student
+        # filter and only differ in aggregation — three CTEs, one scan each,
+        # one 5-column row back.
+        sql_core = """
+            WITH s AS (
+                SELECT
+                    COUNT(*) AS total,
+                    COUNT(CASE WHEN started_at >= DATEADD(day, -7, CURRENT_TIMESTAMP()) THEN 1 END) AS recent
+                FROM practice_sessions
+                WHERE student_id = ?
+            ),
+            f AS (
+                SELECT
+                    AVG(pa.fluency_score) AS avg_f,
+                    AVG(CASE WHEN ps.started_at >= DATEADD(day, -7, CURRENT_TIMESTAMP()) THEN pa.fluency_score END) AS recent_f
+                FROM practice_artifacts pa
+                JOIN practice_sessions ps ON pa.session_id = ps.session_id
+                WHERE ps.student_id = ?
+            ),
+            a AS (
+                SELECT COUNT(*) AS submitted
+                FROM assignments
+                WHERE assigned_to = ? AND status = 'submitted'
+            )
+            SELECT s.total, s.recent, f.avg_f, f.recent_f, a.submitted FROM s, f, a
         """
-        fluency_rows = await execute(sql_fluency, (user_id,), fetch=True)
-        avg_fluency = round(float(fluency_rows[0][0]), 2) if fluency_rows[0][0] is not None else 0.0
-        recent_fluency = round(float(fluency_rows[0][1]), 2) if fluency_rows[0][1] is not None else 0.0
-        
-        f_diff = avg_fluency - recent_fluency # Simplistic trend
-        f_trend = f"{'+' if f_diff >= 0 else ''}{round(f_diff, 1)}%" if recent_fluency > 0 else "New!"
-
-        # 3. Streak (consecutive days)
+        # 3. Streak (consecutive days) — gap-and-islands: consecutive dates share
+        # one (date - row_number) group, so the current streak is the size of the
+        # island that reaches today/yesterday. One vectorized pass, no recursion.
         sql_streak = """
-            WITH RECURSIVE Dates AS (
-                SELECT DISTINCT CAST(started_at AS DATE) as d
-                FROM practice_sessions 
-                WHERE student_id = %s
-            ),
-            Consecutive AS (
-                SELECT d, 1 as streak
-                FROM Dates
-                WHERE d >= DATEADD(day, -1, CURRENT_DATE())
-                
-                UNION ALL
-                
-                SELECT d1.d, c.streak + 1
-                FROM Dates d1
-                JOIN Consecutive c ON d1.d = DATEADD(day, -1, c.d)
+            SELECT MAX(streak) FROM (
+                SELECT COUNT(*) AS streak, MAX(d) AS last_d
+                FROM (
+                    SELECT d, DATEADD(day, -ROW_NUMBER() OVER (ORDER BY d), d) AS grp
+                    FROM (
+                        SELECT DISTINCT CAST(started_at AS DATE) AS d
+                        FROM practice_sessions
+                        WHERE student_id = ?
+                    )
+                )
+                GROUP BY grp
+                HAVING MAX(d) >= DATEADD(day, -1, CURRENT_DATE())
             )
-            SELECT MAX(streak) FROM Consecutive
         """
-        streak_rows = await execute(sql_streak, (user_id,), fetch=True)
-        streak_days = streak_rows[0][0] or 0
-
-        # 4. Badges (Rules-based)
-        badges = []
-        if total_sessions >= 1: badges.append("First Step")
-        if total_sessions >= 10: badges.append("Consistent")
-        if avg_fluency >= 8.0 and total_sessions >= 5: badges.append("Fluency Ace")
-        if streak_days >= 7: badges.append("Week Warrior")
-        
-        # Check for submitted tests/assignments for more badges
-        sql_submitted = "SELECT COUNT(*) FROM assignments WHERE assigned_to = %s AND status = 'submitted'"
-        submit_rows = await execute(sql_submitted, (user_id,), fetch=True)
-        if (submit_rows[0][0] or 0) >= 5: badges.append("Quiz Master")
-
-        # 5. XP & Level
-        xp = (total_sessions * 100) + (submit_rows[0][0] or 0) * 200
-        level = (xp // 1000) + 1
-        xp_progress = (xp % 1000) / 10 # 0-100 percentage for the current level
-
-        # 6. Activity Map (Last 90 days of engagement)
+        # 5. Activity Map (Last 90 days of engagement)
         sql_activity = """
             SELECT 
                 TO_CHAR(CAST(day AS DATE), 'YYYY-MM-DD') as activity_date,
                 COUNT(*) as activity_count
             FROM (
-                SELECT started_at as day FROM practice_sessions WHERE student_id = %s
+                SELECT started_at as day FROM practice_sessions WHERE student_id = ?
                 UNION ALL
-                SELECT ts as day FROM events WHERE user_id = %s AND event_type = 'assignment_submitted'
+                SELECT ts as day FROM events WHERE user_id = ? AND event_type = 'assignment_submitted'
             )
             WHERE day >= DATEADD(day, -90, CURRENT_DATE())
             GROUP BY 1
             ORDER BY 1 ASC
         """
         # Note: events table might be empty if logging is disabled, UNION ALL stays safe
-        activity_rows = await execute(sql_activity, (user_id, user_id), fetch=True)
+        # All three statements are independent — one multi-statement round-trip
+        # replaces the former five sequential network RTTs.
+        core_rows, streak_rows, activity_rows = await execute_multi(
+            [sql_core, sql_streak, sql_activity],
+            (user_id, user_id, user_id, user_id, user_id, user_id),
+        )
+
+        total_sessions = core_rows[0][0] or 0
+        recent_sessions = core_rows[0][1] or 0
+        submitted_count = core_rows[0][4] or 0
+
+        avg_fluency = round(float(core_rows[0][2]), 2) if core_rows[0][2] is not None else 0.0
+        recent_fluency = round(float(core_rows[0][3]), 2) if core_rows[0][3] is not None else 0.0
+
+        f_diff = avg_fluency - recent_fluency # Simplistic trend
+        f_trend = f"{'+' if f_diff >= 0 else ''}{round(f_diff, 1)}%" if recent_fluency > 0 else "New!"
+
+        streak_days = streak_rows[0][0] or 0
+
+        # Badges (Rules-based)
+        badges = []
+        if total_sessions >= 1: badges.append("First Step")
+        if total_sessions >= 10: badges.append("Consistent")
+        if avg_fluency >= 8.0 and total_sessions >= 5: badges.append("Fluency Ace")
+        if streak_days >= 7: badges.append("Week Warrior")
+        if submitted_count >= 5: badges.append("Quiz Master")
+
+        # XP & Level
+        xp = (total_sessions * 100) + submitted_count * 200
+        level = (xp // 1000) + 1
+        xp_progress = (xp % 1000) / 10 # 0-100 percentage for the current level
+
         activity_data = [{"date": r[0], "count": r[1]} for r in (activity_rows or [])]
 
         return {
@@ -2,17 +2,22 @@
 DigitalOcean Spaces (S3-compatible) helper for audio file storage.
 """
 
-import io
 import uuid
+import asyncio
 import boto3
 from botocore.client import Config as BotoConfig
+from functools import lru_cache
 from loguru import logger
 from app.config import get_settings
 
 settings = get_settings()
 
 
+@lru_cache(maxsize=1)
 def _get_client():
+    # One shared client — botocore session setup (credential chain, endpoint
+    # resolution, SSL context) costs tens of ms per construction, and clients
+    # are thread-safe for request dispatch.
     return boto3.client(
         "s3",
         region_name=settings.do_spaces_region,
@@ -23,7 +28,7 @@ def _get_client():
     )
 
 
-def upload_audio(
+async def upload_audio(
     audio_bytes: bytes,
     prefix: str = "audio",
     content_type: str = "audio/mpeg",
@@ -31,14 +36,20 @@ def upload_audio(
 ) -> str:
     """
     Upload audio bytes to DO Spaces. Returns the public (or presigned) URL.
+
+    The PUT runs in a worker thread — a multi-second upload must not block
+    the event loop, and concurrent tier uploads can overlap.
     """
     client = _get_client()
     key = f"{prefix}/{filename or str(uuid.uuid4())}.mp3"
 
-    client.put_object(
+    await asyncio.to_thread(
+        client.put_object,
         Bucket=settings.do_spaces_bucket,
         Key=key,
-        Body=io.BytesIO(audio_bytes),
+        # Raw bytes — boto3 sends the buffer in one shot and sets
+        # Content-Length itself; a BytesIO wrapper just adds a copy.
+        Body=audio_bytes,
         ContentType=content_type,
         ACL="public-read",
     )
@@ -47,6 +58,15 @@ def upload_audio(
     return url
 
 
+async def upload_audio_batch(items: list) -> list:
+    """
+    Upload several audio payloads concurrently. Each item is a dict of
+    upload_audio kwargs (audio_bytes plus optional prefix/content_type/
+    filename); returns URLs in input order.
+    """
+    return list(await asyncio.gather(*(upload_audio(**item) for item in items)))
+
+
 def get_presigned_url(key: str, expires_in: int = 3600) -> str:
     """Generate a time-limited presigned URL for private objects."""
     client = _get_client()
@@ -7,6 +7,9 @@ instruct the LLM to GENERATE original educational content specifically
 designed for each disability profile.
 """
 
+import string
+from functools import lru_cache
+
 # ─────────────────────────────────────────────────────────────────────────────
 # COMMON SYSTEM PROMPT
 # ─────────────────────────────────────────────────────────────────────────────
@@ -294,8 +297,28 @@ CATEGORY_PROMPTS = {
 ALL_CATEGORIES = list(CATEGORY_PROMPTS.keys())
 
 
+def _split_template(template: str) -> list:
+    """Pre-parses a template into (literal, field) segments so per-request
+    substitution is a join instead of re-tokenizing the ~2KB string."""
+    return [(lit, field) for lit, field, _, _ in string.Formatter().parse(template)]
+
+
+# Templates are tokenized once at import — build_generation_prompt runs on
+# every adaptive generation (up to one call per category per lesson).
+_COMPILED = {cat: _split_template(tmpl) for cat, tmpl in CATEGORY_PROMPTS.items()}
+
+
+@lru_cache(maxsize=256)
 def build_generation_prompt(category: str, topic: str, grade: str, description: str) -> tuple[str, str]:
-    """Returns (system_prompt, user_prompt) for a specific disability category."""
-    template = CATEGORY_PROMPTS.get(category.lower(), GENERAL_PROMPT)
-    user_prompt = template.format(topic=topic, grade=grade, description=description)
+    """Returns (system_prompt, user_prompt) for a specific disability category.
+
+    Memoized — the output is a pure function of its inputs, and a lesson
+    generates one prompt per category, so retries and repeat (topic, grade)
+    runs skip the join entirely."""
+    segments = _COMPILED.get(category.lower(), _COMPILED["general"])
+    values = {"topic": topic, "grade": grade, "description": description}
+    user_prompt = "".join(
+        lit + (values[field] if field is not None else "")
+        for lit, field in segments
+    )
     return SYSTEM_PROMPT, user_prompt
@@ -1,4 +1,5 @@
 import io
+import base64
 import mimetypes
 import tempfile
 from pathlib import Path
@@ -16,31 +17,65 @@ SUPPORTED_AUDIO_TYPES = {
 }
 
 
+# Magic-byte prefixes, longest first so e.g. b"ID3" can't shadow a longer
+# signature added later.
+_MAGIC_PREFIXES = (
+    (b"RIFF", "audio/wav"),
+    (b"OggS", "audio/ogg"),
+    (b"ID3", "audio/mpeg"),
+    (b"\xff\xfb", "audio/mpeg"),
+)
+
+
 def detect_mime_type(filename: str, data: bytes) -> str:
     """Detect MIME type from filename extension, fallback to audio/mpeg."""
     mt, _ = mimetypes.guess_type(filename)
     if mt in SUPPORTED_AUDIO_TYPES:
         return mt
-    # Sniff by magic bytes
-    if data[:3] == b"ID3" or data[:2] == b"\xff\xfb":
-        return "audio/mpeg"
-    if data[:4] == b"RIFF":
-        return "audio/wav"
-    if data[:4] == b"OggS":
-        return "audio/ogg"
+    # Sniff by magic bytes — one slice, startswith avoids per-check copies.
+    head = data[:4]
+    for magic, sniffed in _MAGIC_PREFIXES:
+        if head.startswith(magic):
+            return sniffed
     return "audio/mpeg"
 
 
 def save_temp_audio(data: bytes, suffix: str = ".wav") -> str:
-    """Save audio bytes to a temp file and return its path."""
+    """Save audio bytes to a temp file and return its path.
+
+    Only for APIs that need a real path (e.g. ffmpeg subprocess) — in-process
+    consumers should use audio_buffer and skip the disk round-trip.
+    """
     tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
     tmp.write(data)
     tmp.close()
     return tmp.name
 
 
+def audio_buffer(data: bytes, suffix: str = ".wav") -> io.BytesIO:
+    """Wrap audio bytes in a named file-like object.
+
+    The .name attribute duck-types for libraries that sniff format from the
+    filename, without writing data already in RAM out to disk and back.
+    """
+    buf = io.BytesIO(data)
+    buf.name = f"audio{suffix}"
+    return buf
+
+
+# Multiple of 3 so each chunk encodes without padding and chunks concatenate
+# into valid base64.
+_B64_CHUNK = 3 * 64 * 1024
+
+
 def audio_to_base64(path: str) -> str:
-    """Read an audio file and return base64-encoded string."""
-    import base64
+    """Read an audio file and return base64-encoded string.
+
+    Encodes in chunks so the raw file is never held in memory alongside its
+    4/3-expanded encoding — only the result string is full-size.
+    """
+    chunks = []
     with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
+        while chunk := f.read(_B64_CHUNK):
+            chunks.append(base64.b64encode(chunk))
+    return b"".join(chunks).decode("ascii")
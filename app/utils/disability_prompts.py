@@ -2,8 +2,11 @@
 Disability-specific prompts for rewriting educational content via LangGraph.
 """
 
+from functools import lru_cache
 from typing import Optional
 
+from app.utils.prompts import _compile_template, _render
+
 ADAPT_PASSAGE_SYSTEM = """You are an expert special education teacher and instructional designer.
 Your task is to take a standard educational passage and strictly rewrite it to accommodate a specific student's neurodivergent or disability profile, and their preferred learning style.
 Do NOT change the core educational facts, but deeply transform the presentation, vocabulary, structure, and formatting.
@@ -15,20 +18,24 @@ The output JSON must have this exact structure:
 }
 """
 
-ADAPT_PASSAGE_USER_TEMPLATE = """Adapt the following educational text.
+# Static-prefix layout: the instruction and (per-profile) rules lead, the
+# per-request text trails — provider prompt caching needs a byte-identical
+# prefix, so nothing request-specific may appear before the rules.
+ADAPT_PASSAGE_STATIC_PREFIX = """Adapt the educational text given at the end of this message.
+
+Apply the following specific adaptation rules based on the student's profile:"""
 
-Student's Primary Disability/Need: {disability_type}
+ADAPT_PASSAGE_DYNAMIC_TEMPLATE = """Student's Primary Disability/Need: {disability_type}
 Student's Preferred Learning Style: {learning_style}
 
 Original Text:
 \"\"\"
 {base_text}
 \"\"\"
-
-Apply the following specific adaptation rules based on their profile:
-{adaptation_rules}
 """
 
+_ADAPT_DYNAMIC_SEGMENTS = _compile_template(ADAPT_PASSAGE_DYNAMIC_TEMPLATE)
+
 # -------------- PREDEFINED RULES --------------
 
 RULES_ADHD = """
@@ -101,48 +108,55 @@ GENERAL INCLUSIVE RULES:
 - Provide a brief summary at the end.
 """
 
+# Dispatch tables built once at import — O(1) lookups instead of walking the
+# branch ladders on every adaptation request.
+_RULES_MAP = {
+    "adhd": RULES_ADHD,
+    "autism": RULES_AUTISM,
+    "dyslexia": RULES_DYSLEXIA,
+    "visual": RULES_VISUAL,
+    "hearing": RULES_HEARING,
+    "intellectual": RULES_INTELLECTUAL,
+    "speech": RULES_SPEECH,
+    "stammering": RULES_SPEECH,
+    "motor": RULES_MOTOR,
+}
+
+_LS_MAP = {
+    "visual": "- Emphasize visual metaphors, color mentions, and spatial relationships.",
+    "auditory": "- Make the text conversational and rhythmic, suitable for listening.",
+    "kinesthetic": "- Relate concepts to physical sensations, movement, and real-world actions.",
+    "reading_writing": "- Focus on deep textual analysis, rich vocabulary, and structured note-taking cues.",
+}
+
+
 def get_adaptation_rules(disability_type: str) -> str:
     """Returns the specific adaptation rules based on the disability type."""
-    dt = (disability_type or "general").lower()
-    
-    if dt == "adhd": return RULES_ADHD
-    if dt == "autism": return RULES_AUTISM
-    if dt == "dyslexia": return RULES_DYSLEXIA
-    if dt == "visual": return RULES_VISUAL
-    if dt == "hearing": return RULES_HEARING
-    if dt == "intellectual": return RULES_INTELLECTUAL
-    if dt in ("speech", "stammering"): return RULES_SPEECH
-    if dt == "motor": return RULES_MOTOR
-    
-    return RULES_GENERAL
+    return _RULES_MAP.get((disability_type or "").lower(), RULES_GENERAL)
 
 def get_learning_style_addendum(learning_style: str) -> str:
     """Returns a short addendum for the learning style (Visual, Auditory, Kinesthetic, Reading/Writing)."""
-    ls = (learning_style or "none").lower()
-    
-    if ls == "visual":
-        return "- Emphasize visual metaphors, color mentions, and spatial relationships."
-    if ls == "auditory":
-        return "- Make the text conversational and rhythmic, suitable for listening."
-    if ls == "kinesthetic":
-        return "- Relate concepts to physical sensations, movement, and real-world actions."
-    if ls == "reading_writing":
-        return "- Focus on deep textual analysis, rich vocabulary, and structured note-taking cues."
-        
-    return ""
+    return _LS_MAP.get((learning_style or "").lower(), "")
+
+@lru_cache(maxsize=64)
+def _static_head(disability_type: str, learning_style: str) -> str:
+    """Prefix + rules + style addendum — only ~45 profile combinations exist,
+    so the join runs once per pair for the process lifetime."""
+    parts = [ADAPT_PASSAGE_STATIC_PREFIX, get_adaptation_rules(disability_type)]
+    ls_addendum = get_learning_style_addendum(learning_style)
+    if ls_addendum:
+        parts.append(f"ADDITIONAL LEARNING STYLE RULES:\n{ls_addendum}")
+    return "\n\n".join(parts)
+
 
 def build_adaptation_prompt(base_text: str, disability_type: str, learning_style: str) -> tuple[str, str]:
     """Returns (system_prompt, user_prompt) for the adaptation model."""
-    rules = get_adaptation_rules(disability_type)
-    ls_addendum = get_learning_style_addendum(learning_style)
-    
-    combined_rules = f"{rules}\n\nADDITIONAL LEARNING STYLE RULES ({learning_style}):\n{ls_addendum}"
-    
-    user_prompt = ADAPT_PASSAGE_USER_TEMPLATE.format(
-        disability_type=disability_type,
-        learning_style=learning_style,
-        base_text=base_text,
-        adaptation_rules=combined_rules
+    user_prompt = _static_head(disability_type, learning_style) + "\n\n" + _render(
+        _ADAPT_DYNAMIC_SEGMENTS,
+        {
+            "disability_type": disability_type,
+            "learning_style": learning_style,
+            "base_text": base_text,
+        },
     )
-    
     return ADAPT_PASSAGE_SYSTEM, user_prompt
@@ -1,5 +1,20 @@
+import string
+from functools import lru_cache
 from typing import Optional
 
+
+def _compile_template(template: str) -> list:
+    """Pre-parses a template into (literal, field) segments once at import, so
+    per-request rendering is a join instead of re-tokenizing the string."""
+    return [(lit, field) for lit, field, _, _ in string.Formatter().parse(template)]
+
+
+def _render(segments: list, values: dict) -> str:
+    return "".join(
+        lit + (str(values[field]) if field is not None else "")
+        for lit, field in segments
+    )
+
 # ─────────────────────────────────────────────────────────────────────────────
 # LESSON GENERATION PROMPT
 # ─────────────────────────────────────────────────────────────────────────────
@@ -8,36 +23,35 @@ LESSON_GEN_SYSTEM = """You are an expert curriculum designer specializing in dif
 Your task is to generate reading passages and comprehension questions at multiple difficulty tiers for K-12 students.
 Always output strict JSON — no markdown, no prose outside the JSON envelope."""
 
-LESSON_GEN_USER_TEMPLATE = """Generate a differentiated reading lesson with the following parameters:
-- Topic: {topic}
-- Grade Level: {grade}
-- Number of Tiers: {tiers}
-- Language: {language}
-{base_text_section}
+# Static-prefix layout: everything that never changes between calls (schema,
+# rules) comes first so provider-side prompt caching sees a byte-identical
+# prefix; per-request fields trail at the end of the message.
+
+LESSON_GEN_STATIC_PREFIX = """Generate a differentiated reading lesson for the parameters listed at the end of this message.
 
 Output JSON with this exact structure:
-{{
+{
   "tiers": [
-    {{
+    {
       "level": 1,
       "label": "Foundational",
       "passage": "<100-150 word passage, very simple vocabulary>",
       "questions": ["Q1", "Q2", "Q3"]
-    }},
-    {{
+    },
+    {
       "level": 2,
       "label": "Grade-Level",
       "passage": "<200-250 word passage, grade-appropriate>",
       "questions": ["Q1", "Q2", "Q3", "Q4"]
-    }},
-    {{
+    },
+    {
       "level": 3,
       "label": "Advanced",
       "passage": "<300-350 word passage, enriched vocabulary and analysis>",
       "questions": ["Q1", "Q2", "Q3", "Q4", "Q5"]
-    }}
+    }
   ]
-}}
+}
 
 Rules:
 - Tiers should escalate in vocabulary complexity, passage length, and question depth.
@@ -46,8 +60,17 @@ Rules:
 - Use inclusive, culturally neutral language.
 - Output ONLY the JSON object. No additional text."""
 
+LESSON_GEN_DYNAMIC_TEMPLATE = """Parameters for this lesson:
+- Topic: {topic}
+- Grade Level: {grade}
+- Number of Tiers: {tiers}
+- Language: {language}
+{base_text_section}"""
+
 BASE_TEXT_TEMPLATE = "- Base Text to adapt: ```{base_text}```"
 
+_LESSON_DYNAMIC_SEGMENTS = _compile_template(LESSON_GEN_DYNAMIC_TEMPLATE)
+
 # ─── LEARNING STYLE ADDENDUMS ───
 
 VISUAL_STYLE_ADDENDUM = """
@@ -86,39 +109,39 @@ LEARNING STYLE: READING/WRITING
 SPEECH_ANALYSIS_SYSTEM = """You are an expert English language coach providing structured feedback to students.
 Always output strict JSON. Be encouraging and constructive — never use harsh or discouraging language."""
 
-SPEECH_ANALYSIS_USER_TEMPLATE = """Analyze the following student speech transcript and provide detailed feedback.
-
-Mode: {mode}
-Transcript:
-\"\"\"
-{transcript}
-\"\"\"
-
-{accessibility_addendum}
+SPEECH_ANALYSIS_STATIC_PREFIX = """Analyze the student speech transcript given at the end of this message and provide detailed feedback.
 
 Score the student on a scale of 0-10 for each dimension, and identify specific word/phrase-level issues.
 
 Output JSON with this exact structure:
-{{
-  "scores": {{
+{
+  "scores": {
     "fluency": <0-10>,
     "grammar": <0-10>,
     "confidence": <0-10>,
     "pronunciation": <0-10>
-  }},
+  },
   "feedback_text": "<2-3 sentences of supportive, actionable feedback>",
   "word_marks": [
-    {{"word": "<word>", "issue": "<mispronounced|grammar|hesitation>", "suggestion": "<correction>"}}
+    {"word": "<word>", "issue": "<mispronounced|grammar|hesitation>", "suggestion": "<correction>"}
   ],
   "strengths": ["<strength 1>", "<strength 2>"],
   "next_steps": ["<step 1>", "<step 2>"]
-}}
+}
 
 Rules:
 - feedback_text must be warm, supportive, and end on a positive note.
 - word_marks should identify at most 5 issues — focus on the most impactful ones.
 - If transcript is empty or inaudible, set all scores to 0 and feedback_text to an encouraging retry message."""
 
+SPEECH_ANALYSIS_DYNAMIC_TEMPLATE = """Mode: {mode}
+Transcript:
+\"\"\"
+{transcript}
+\"\"\""""
+
+_SPEECH_DYNAMIC_SEGMENTS = _compile_template(SPEECH_ANALYSIS_DYNAMIC_TEMPLATE)
+
 STAMMER_FRIENDLY_ADDENDUM = """
 IMPORTANT — STAMMER-FRIENDLY MODE IS ACTIVE:
 - Do NOT penalize repetitions, prolongations, or blocks in the fluency score.
@@ -142,6 +165,7 @@ ACCESSIBILITY NOTE — NEURODIVERGENT-FRIENDLY MODE:
 - Celebrate effort explicitly in feedback_text."""
 
 
+@lru_cache(maxsize=512)
 def build_lesson_prompt(
     topic: str,
     grade: str,
@@ -150,11 +174,14 @@ def build_lesson_prompt(
     base_text: Optional[str] = None,
     learning_style: Optional[str] = None,
 ) -> tuple[str, str]:
-    """Returns (system_prompt, user_prompt) for lesson generation."""
+    """Returns (system_prompt, user_prompt) for lesson generation.
+
+    Memoized — classrooms regenerate the same (topic, grade, tiers, language)
+    combinations, so repeats skip the render entirely."""
     base_text_section = (
         BASE_TEXT_TEMPLATE.format(base_text=base_text) if base_text else ""
     )
-    
+
     style_addendum = ""
     if learning_style == "visual":
         style_addendum = VISUAL_STYLE_ADDENDUM
@@ -164,19 +191,42 @@ def build_lesson_prompt(
         style_addendum = KINESTHETIC_STYLE_ADDENDUM
     elif learning_style == "reading_writing":
         style_addendum = READING_STYLE_ADDENDUM
-        
-    user_prompt = LESSON_GEN_USER_TEMPLATE.format(
-        topic=topic,
-        grade=grade,
-        tiers=tiers,
-        language=language,
-        base_text_section=base_text_section,
-    )
-    
+
+    # Static prefix (and per-style addendum) first, request fields last — the
+    # cacheable prefix stays byte-identical across calls for the same style.
+    parts = [LESSON_GEN_STATIC_PREFIX]
     if style_addendum:
-        user_prompt += f"\n\n{style_addendum}"
-        
-    return LESSON_GEN_SYSTEM, user_prompt
+        parts.append(style_addendum)
+    parts.append(_render(_LESSON_DYNAMIC_SEGMENTS, {
+        "topic": topic,
+        "grade": grade,
+        "tiers": tiers,
+        "language": language,
+        "base_text_section": base_text_section,
+    }))
+    return LESSON_GEN_SYSTEM, "\n\n".join(parts)
+
+
+# All 8 accessibility-flag combinations, prejoined at import and indexed by a
+# 3-bit mask (stammer=1, hearing=2, neurodivergent=4) — the per-request hot
+# path becomes a tuple lookup instead of branches plus a join. The prefix is
+# still byte-identical per combination, so provider prompt caching hits
+# across students.
+_SPEECH_HEAD_TABLE = tuple(
+    "\n\n".join(
+        [SPEECH_ANALYSIS_STATIC_PREFIX]
+        + [
+            addendum
+            for bit, addendum in (
+                (1, STAMMER_FRIENDLY_ADDENDUM),
+                (2, HEARING_IMPAIRED_ADDENDUM),
+                (4, NEURODIVERGENT_ADDENDUM),
+            )
+            if mask & bit
+        ]
+    )
+    for mask in range(8)
+)
 
 
 def build_speech_analysis_prompt(
@@ -187,19 +237,8 @@ def build_speech_analysis_prompt(
     neurodivergent: bool = False,
 ) -> tuple[str, str]:
     """Returns (system_prompt, user_prompt) for speech analysis."""
-    addendums = []
-    if stammer_friendly:
-        addendums.append(STAMMER_FRIENDLY_ADDENDUM)
-    if hearing_impaired:
-        addendums.append(HEARING_IMPAIRED_ADDENDUM)
-    if neurodivergent:
-        addendums.append(NEURODIVERGENT_ADDENDUM)
-
-    accessibility_addendum = "\n".join(addendums)
-
-    user_prompt = SPEECH_ANALYSIS_USER_TEMPLATE.format(
-        mode=mode,
-        transcript=transcript,
-        accessibility_addendum=accessibility_addendum,
+    mask = (bool(stammer_friendly) << 0) | (bool(hearing_impaired) << 1) | (bool(neurodivergent) << 2)
+    user_prompt = _SPEECH_HEAD_TABLE[mask] + "\n\n" + _render(
+        _SPEECH_DYNAMIC_SEGMENTS, {"mode": mode, "transcript": transcript}
     )
     return SPEECH_ANALYSIS_SYSTEM, user_prompt
@@ -1,9 +1,8 @@
 import asyncio
-from app.services.snowflake_db import execute
+from app.services.snowflake_db import ensure_tables
 
-async def main():
-    sql = """
-    CREATE TABLE IF NOT EXISTS tests (
+TESTS_DDL = """
+    CREATE TABLE tests (
         test_id VARCHAR PRIMARY KEY,
         teacher_id VARCHAR,
         title VARCHAR,
@@ -12,10 +11,12 @@ async def main():
         time_limit INT,
         questions VARIANT,
         created_at TIMESTAMP_TZ DEFAULT CURRENT_TIMESTAMP
-    );
-    """
-    await execute(sql)
-    print("Tests table created.")
+    )
+"""
+
+async def main():
+    created = await ensure_tables({"tests": TESTS_DDL})
+    print("Tests table created." if created else "Tests table already exists.")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,24 @@
+# AUTO-GENERATED from snowflake_init.sql by compile_init_sql.py — do not edit
+SOURCE_SHA256 = "bcf558183f0c9fb0c14801d1e6ac12c6e6bd4f07d8b47f7110a684b73f4f4479"
+
+STATEMENTS = [
+    "CREATE TABLE IF NOT EXISTS users (\n    user_id                  VARCHAR(128)  NOT NULL PRIMARY KEY,\n    role                     VARCHAR(32)   NOT NULL DEFAULT 'student',\n    school_id                VARCHAR(128),\n    accessibility_profile_json VARIANT,\n    created_at               TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP\n)",
+    'CREATE TABLE IF NOT EXISTS lessons (\n    lesson_id   VARCHAR(128)  NOT NULL PRIMARY KEY,\n    teacher_id  VARCHAR(128)  NOT NULL,\n    topic       VARCHAR(512)  NOT NULL,\n    grade       VARCHAR(16)   NOT NULL,\n    tiers       NUMBER(2)     NOT NULL DEFAULT 3,\n    content_json VARIANT,\n    created_at  TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP,\n    FOREIGN KEY (teacher_id) REFERENCES users(user_id)\n)',
+    "CREATE TABLE IF NOT EXISTS assignments (\n    assignment_id VARCHAR(128)  NOT NULL PRIMARY KEY,\n    lesson_id     VARCHAR(128)  NOT NULL,\n    teacher_id    VARCHAR(128)  NOT NULL,\n    assigned_to   VARCHAR(128)  NOT NULL,\n    due_date      VARCHAR(64),\n    status        VARCHAR(32)   NOT NULL DEFAULT 'pending',\n    created_at    TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP,\n    FOREIGN KEY (lesson_id) REFERENCES lessons(lesson_id),\n    FOREIGN KEY (teacher_id) REFERENCES users(user_id)\n)",
+    'CREATE TABLE IF NOT EXISTS lesson_assets (\n    lesson_id   VARCHAR(128)  NOT NULL,\n    level       NUMBER(2)     NOT NULL,\n    audio_url   VARCHAR(2048),\n    pdf_url     VARCHAR(2048),\n    checksum    VARCHAR(64),\n    created_at  TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP,\n    PRIMARY KEY (lesson_id, level),\n    FOREIGN KEY (lesson_id) REFERENCES lessons(lesson_id)\n)',
+    'CREATE TABLE IF NOT EXISTS practice_sessions (\n    session_id              VARCHAR(128)  NOT NULL PRIMARY KEY,\n    student_id              VARCHAR(128)  NOT NULL,\n    lesson_id               VARCHAR(128),\n    mode                    VARCHAR(64)   NOT NULL,\n    accessibility_mode_json VARIANT,\n    started_at              TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP,\n    ended_at                TIMESTAMP_NTZ,\n    FOREIGN KEY (student_id) REFERENCES users(user_id),\n    FOREIGN KEY (lesson_id)  REFERENCES lessons(lesson_id)\n)',
+    'CREATE TABLE IF NOT EXISTS practice_artifacts (\n    artifact_id     VARCHAR(128)   DEFAULT UUID_STRING() PRIMARY KEY,\n    session_id      VARCHAR(128)   NOT NULL,\n    audio_url       VARCHAR(2048),\n    transcript_text TEXT,\n    feedback_json   VARIANT,\n    scores_json     VARIANT,\n    fluency_score    FLOAT,\n    grammar_score    FLOAT,\n    confidence_score FLOAT,\n    created_at      TIMESTAMP_NTZ  DEFAULT CURRENT_TIMESTAMP,\n    FOREIGN KEY (session_id) REFERENCES practice_sessions(session_id)\n)',
+    'ALTER TABLE practice_artifacts ADD COLUMN IF NOT EXISTS fluency_score    FLOAT',
+    'ALTER TABLE practice_artifacts ADD COLUMN IF NOT EXISTS grammar_score    FLOAT',
+    'ALTER TABLE practice_artifacts ADD COLUMN IF NOT EXISTS confidence_score FLOAT',
+    'UPDATE practice_artifacts SET\n    fluency_score    = scores_json:fluency::FLOAT,\n    grammar_score    = scores_json:grammar::FLOAT,\n    confidence_score = scores_json:confidence::FLOAT\nWHERE fluency_score IS NULL AND scores_json IS NOT NULL',
+    'CREATE TABLE IF NOT EXISTS events (\n    event_id    VARCHAR(128)  DEFAULT UUID_STRING() PRIMARY KEY,\n    user_id     VARCHAR(128)  NOT NULL,\n    event_type  VARCHAR(128)  NOT NULL,\n    payload_json VARIANT,\n    session_id  VARCHAR(128),\n    lesson_id   VARCHAR(128),\n    ts          TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP,\n    FOREIGN KEY (user_id) REFERENCES users(user_id)\n)',
+    'ALTER TABLE events ADD COLUMN IF NOT EXISTS session_id VARCHAR(128)',
+    'ALTER TABLE events ADD COLUMN IF NOT EXISTS lesson_id  VARCHAR(128)',
+    'ALTER TABLE lessons           CLUSTER BY (teacher_id, created_at)',
+    'ALTER TABLE practice_sessions CLUSTER BY (student_id, started_at)',
+    'ALTER TABLE events            CLUSTER BY (user_id, ts, event_type)',
+    'ALTER TABLE assignments       CLUSTER BY (assigned_to, created_at)',
+    'CREATE OR REPLACE VIEW v_student_progress AS\nSELECT\n    ps.student_id,\n    ps.lesson_id,\n    l.topic,\n    l.grade,\n    ps.mode,\n    ps.started_at,\n    ps.ended_at,\n    pa.fluency_score                  AS fluency,\n    pa.grammar_score                  AS grammar,\n    pa.confidence_score               AS confidence,\n    pa.scores_json:pronunciation::FLOAT AS pronunciation,\n    pa.transcript_text,\n    ps.accessibility_mode_json\nFROM practice_sessions ps\nLEFT JOIN practice_artifacts pa ON ps.session_id = pa.session_id\nLEFT JOIN lessons l ON ps.lesson_id = l.lesson_id',
+    "CREATE OR REPLACE VIEW v_accessibility_events AS\nSELECT\n    e.user_id,\n    e.event_type,\n    e.ts,\n    u.role,\n    u.school_id,\n    e.payload_json\nFROM events e\nJOIN users u ON e.user_id = u.user_id\nWHERE e.event_type LIKE '%_on' OR e.event_type LIKE '%_off'",
+]
@@ -4,15 +4,13 @@ One-off script to create the assignments table in Snowflake without re-running t
 
 import asyncio
 import logging
-from app.services.snowflake_db import execute
+from app.services.snowflake_db import ensure_tables
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def main():
-    logger.info("Connecting to Snowflake to create assignments table...")
-    sql = """
-    CREATE TABLE IF NOT EXISTS assignments (
+ASSIGNMENTS_DDL = """
+    CREATE TABLE assignments (
         assignment_id VARCHAR(128)  NOT NULL PRIMARY KEY,
         lesson_id     VARCHAR(128)  NOT NULL,
         teacher_id    VARCHAR(128)  NOT NULL,
@@ -22,10 +20,16 @@ async def main():
         created_at    TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP,
         FOREIGN KEY (lesson_id) REFERENCES lessons(lesson_id),
         FOREIGN KEY (teacher_id) REFERENCES users(user_id)
-    );
-    """
-    await execute(sql)
-    logger.info("Successfully created assignments table.")
+    )
+"""
+
+async def main():
+    logger.info("Checking Snowflake for the assignments table...")
+    created = await ensure_tables({"assignments": ASSIGNMENTS_DDL})
+    if created:
+        logger.info("Successfully created assignments table.")
+    else:
+        logger.info("Assignments table already exists — nothing to do.")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+Precompiles snowflake_init.sql into scripts/_snowflake_init_compiled.py.
+
+The SQL file is static and versioned, so parsing it on every init run is
+wasted work — and a parse error should surface when the file changes, not
+at deploy time. Re-run this after editing snowflake_init.sql:
+
+    python scripts/compile_init_sql.py
+"""
+
+import hashlib
+from pathlib import Path
+
+SQL_PATH = Path(__file__).parent / "snowflake_init.sql"
+OUT_PATH = Path(__file__).parent / "_snowflake_init_compiled.py"
+
+
+def iter_statements(path):
+    """Single-pass statement splitter. Unlike a naive split(';'), this
+    respects ';' inside '...' string literals and $$...$$ bodies."""
+    buf = []
+    in_str = in_dollar = False
+    with open(path) as f:
+        for line in f:
+            if line.lstrip().startswith("--"):
+                continue
+            i, n = 0, len(line)
+            while i < n:
+                ch = line[i]
+                if not in_str and line.startswith("$$", i):
+                    in_dollar = not in_dollar
+                    buf.append("$$")
+                    i += 2
+                    continue
+                if ch == "'" and not in_dollar:
+                    in_str = not in_str
+                if ch == ";" and not in_str and not in_dollar:
+                    stmt = "".join(buf).strip()
+                    if stmt and not stmt.upper().startswith("USE "):
+                        yield stmt
+                    buf = []
+                else:
+                    buf.append(ch)
+                i += 1
+    stmt = "".join(buf).strip()
+    if stmt and not stmt.upper().startswith("USE "):
+        yield stmt
+
+
+def source_sha256(path=SQL_PATH) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def main():
+    statements = list(iter_statements(SQL_PATH))
+    with open(OUT_PATH, "w") as out:
+        out.write("# AUTO-GENERATED from snowflake_init.sql by compile_init_sql.py — do not edit\n")
+        out.write(f'SOURCE_SHA256 = "{source_sha256()}"\n\n')
+        out.write("STATEMENTS = [\n")
+        for stmt in statements:
+            out.write(f"    {stmt!r},\n")
+        out.write("]\n")
+    print(f"Wrote {len(statements)} statements to {OUT_PATH.name}")
+
+
+if __name__ == "__main__":
+    main()
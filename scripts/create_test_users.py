@@ -1,16 +1,36 @@
-import requests
+import asyncio
+
+import httpx
 
 BASE_URL = "http://localhost:8000"
 
-def register_user(name, email, role):
-    response = requests.post(f"{BASE_URL}/auth/register", json={
+# Register a completely fresh teacher and student
+USERS = [
+    ("Test Teacher", "testteacher@example.com", "teacher"),
+    ("Test Student", "teststudent@example.com", "student"),
+]
+
+
+async def register_user(client: httpx.AsyncClient, name: str, email: str, role: str):
+    response = await client.post("/auth/register", json={
         "name": name,
         "email": email,
         "password": "password",
-        "role": role
+        "role": role,
     })
     print(f"[{role.upper()}] Register {email}: {response.status_code} - {response.text}")
 
-# Register a completely fresh teacher and student
-register_user("Test Teacher", "testteacher@example.com", "teacher")
-register_user("Test Student", "teststudent@example.com", "student")
+
+async def main():
+    # One keep-alive client for the whole batch — registrations share a
+    # connection and run concurrently instead of one TCP setup each.
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    ) as client:
+        await asyncio.gather(*(register_user(client, *u) for u in USERS))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
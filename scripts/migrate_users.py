@@ -1,24 +1,27 @@
 import asyncio
 from loguru import logger
-from app.services.snowflake_db import execute
+from app.services.snowflake_db import execute_multi
 
 async def migrate_users():
     logger.info("Starting schema migration for users table...")
-    
+
+    # IF NOT EXISTS keeps each statement idempotent, so the whole migration
+    # can go to Snowflake as one multi-statement round-trip instead of one
+    # warehouse round-trip (queue + compile + commit) per ALTER.
     queries = [
-        "ALTER TABLE users ADD COLUMN sub_role VARCHAR;",
-        "ALTER TABLE users ADD COLUMN disability_type VARCHAR;",
-        "ALTER TABLE users ADD COLUMN learning_style VARCHAR;",
-        "ALTER TABLE users ADD COLUMN onboarding_complete BOOLEAN DEFAULT FALSE;"
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS sub_role VARCHAR",
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS disability_type VARCHAR",
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS learning_style VARCHAR",
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS onboarding_complete BOOLEAN DEFAULT FALSE",
     ]
-    
-    for q in queries:
-        try:
-            await execute(q)
+
+    try:
+        await execute_multi(queries)
+        for q in queries:
             logger.info(f"Executed: {q}")
-        except Exception as e:
-            logger.warning(f"Failed to execute ({q}): {e}")
-            
+    except Exception as e:
+        logger.warning(f"Migration batch failed: {e}")
+
     logger.info("Migration complete.")
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@
 """
 Run the Snowflake init SQL script using credentials from .env
 """
-import os, sys
+import os, re, sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -50,30 +51,49 @@ for stmt in setup:
             print(f"  ❌  {stmt}\n      {msg}")
             sys.exit(1) # We must stop if schema setup fails
 
-# Run the init SQL
+# Run the init SQL. Prefer the precompiled statement list (generated by
+# compile_init_sql.py) and fall back to parsing on the fly if it is missing
+# or stale relative to snowflake_init.sql.
 sql_path = Path(__file__).parent.parent / "scripts" / "snowflake_init.sql"
-raw_sql  = sql_path.read_text()
-
-# Remove comments line by line first, then split on semicolon
-cleaned_lines = []
-for line in raw_sql.splitlines():
-    if not line.strip().startswith("--"):
-        cleaned_lines.append(line)
-
-statements = []
-for s in "\n".join(cleaned_lines).split(";"):
-    s = s.strip()
-    if not s:
-        continue
-    if s.upper().startswith("USE "):
-        continue
-    statements.append(s)
 
-ok, errors = 0, []
+from compile_init_sql import iter_statements, source_sha256
+
+try:
+    import _snowflake_init_compiled as _compiled
+except ImportError:
+    _compiled = None
+
+if _compiled is not None and _compiled.SOURCE_SHA256 == source_sha256(sql_path):
+    statements = list(_compiled.STATEMENTS)
+else:
+    if _compiled is not None:
+        print("⚠️  _snowflake_init_compiled.py is stale — re-run scripts/compile_init_sql.py")
+    statements = list(iter_statements(sql_path))
+
+_CREATE_RE = re.compile(r"CREATE TABLE IF NOT EXISTS\s+(\w+)", re.I)
+_REF_RE = re.compile(r"REFERENCES\s+(\w+)", re.I)
+
+# Partition: CREATE TABLEs get topologically waved on their FK references so
+# independent tables compile in parallel; everything else (ALTER, UPDATE,
+# views) stays serial in file order since those can depend on each other.
+creates, rest = {}, []
 for stmt in statements:
+    m = _CREATE_RE.search(stmt)
+    if m:
+        creates[m.group(1).lower()] = stmt
+    else:
+        rest.append(stmt)
+
+ok, errors = 0, []
+
+def run_stmt(stmt: str):
+    """Each worker gets its own cursor — cursors on one connection are safe
+    to use from separate threads."""
+    global ok
     first = stmt.splitlines()[0][:90]
     try:
-        cur.execute(stmt)
+        with conn.cursor() as c:
+            c.execute(stmt)
         print(f"  ✅  {first}")
         ok += 1
     except Exception as e:
@@ -85,6 +105,24 @@ for stmt in statements:
             print(f"  ❌  {first}\n      {msg}")
             errors.append(first)
 
+pending = dict(creates)
+with ThreadPoolExecutor(max_workers=8) as pool:
+    while pending:
+        # A table is ready once every table it references is already created.
+        wave = [
+            name for name, stmt in pending.items()
+            if all(ref.lower() == name or ref.lower() not in pending
+                   for ref in _REF_RE.findall(stmt))
+        ]
+        if not wave:  # circular/self references — fall back to serial order
+            wave = list(pending)
+        list(pool.map(run_stmt, (pending[name] for name in wave)))
+        for name in wave:
+            del pending[name]
+
+for stmt in rest:
+    run_stmt(stmt)
+
 cur.close()
 conn.close()
 
@@ -0,0 +1,41 @@
+"""
+Single entry point for the ad-hoc Snowflake checks that used to live in
+check_lessons.py / test_db.py / test_sf.py / test_snowflake.py.
+
+Each of those scripts paid full event-loop + connection + auth startup for
+one query; running several commands here shares one pooled connection:
+
+    python scripts/sf_shell.py desc-lessons list-users
+    python scripts/sf_shell.py            # runs every command
+"""
+
+import asyncio
+import sys
+
+from app.services.snowflake_db import execute, close_pool
+
+COMMANDS = {
+    "desc-lessons": "DESCRIBE TABLE lessons",
+    "desc-assignments": "DESC TABLE assignments",
+    "list-users": "SELECT user_id, name, email FROM users",
+}
+
+
+async def main():
+    names = sys.argv[1:] or list(COMMANDS)
+    unknown = [n for n in names if n not in COMMANDS]
+    if unknown:
+        print(f"Unknown command(s): {', '.join(unknown)} — choose from {', '.join(COMMANDS)}")
+        sys.exit(1)
+    for name in names:
+        rows = await execute(COMMANDS[name], fetch=True)
+        print(f"--- {name} ---")
+        for r in rows:
+            print(r)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    finally:
+        close_pool()
@@ -71,24 +71,48 @@ CREATE TABLE IF NOT EXISTS practice_artifacts (
     transcript_text TEXT,
     feedback_json   VARIANT,
     scores_json     VARIANT,
+    -- Typed score columns, populated at write time — aggregates read these
+    -- directly instead of extracting from the VARIANT per row.
+    fluency_score    FLOAT,
+    grammar_score    FLOAT,
+    confidence_score FLOAT,
     created_at      TIMESTAMP_NTZ  DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (session_id) REFERENCES practice_sessions(session_id)
 );
 
+-- Migration for pre-existing deployments: add the typed columns and backfill
+-- them once from the VARIANT payloads.
+ALTER TABLE practice_artifacts ADD COLUMN IF NOT EXISTS fluency_score    FLOAT;
+ALTER TABLE practice_artifacts ADD COLUMN IF NOT EXISTS grammar_score    FLOAT;
+ALTER TABLE practice_artifacts ADD COLUMN IF NOT EXISTS confidence_score FLOAT;
+UPDATE practice_artifacts SET
+    fluency_score    = scores_json:fluency::FLOAT,
+    grammar_score    = scores_json:grammar::FLOAT,
+    confidence_score = scores_json:confidence::FLOAT
+WHERE fluency_score IS NULL AND scores_json IS NOT NULL;
+
 -- ─── Events ───────────────────────────────────────────────────────────────────
 CREATE TABLE IF NOT EXISTS events (
     event_id    VARCHAR(128)  DEFAULT UUID_STRING() PRIMARY KEY,
     user_id     VARCHAR(128)  NOT NULL,
     event_type  VARCHAR(128)  NOT NULL,
     payload_json VARIANT,
+    -- Most payloads carry one or both of these — typed copies let queries
+    -- filter/prune without touching the VARIANT.
+    session_id  VARCHAR(128),
+    lesson_id   VARCHAR(128),
     ts          TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(user_id)
 );
 
+ALTER TABLE events ADD COLUMN IF NOT EXISTS session_id VARCHAR(128);
+ALTER TABLE events ADD COLUMN IF NOT EXISTS lesson_id  VARCHAR(128);
+
 -- ─── Indexes / Clustering ─────────────────────────────────────────────────────
 ALTER TABLE lessons           CLUSTER BY (teacher_id, created_at);
 ALTER TABLE practice_sessions CLUSTER BY (student_id, started_at);
 ALTER TABLE events            CLUSTER BY (user_id, ts, event_type);
+ALTER TABLE assignments       CLUSTER BY (assigned_to, created_at);
 
 -- ─── Analytics Views ──────────────────────────────────────────────────────────
 CREATE OR REPLACE VIEW v_student_progress AS
@@ -100,9 +124,9 @@ SELECT
     ps.mode,
     ps.started_at,
     ps.ended_at,
-    pa.scores_json:fluency::FLOAT     AS fluency,
-    pa.scores_json:grammar::FLOAT     AS grammar,
-    pa.scores_json:confidence::FLOAT  AS confidence,
+    pa.fluency_score                  AS fluency,
+    pa.grammar_score                  AS grammar,
+    pa.confidence_score               AS confidence,
     pa.scores_json:pronunciation::FLOAT AS pronunciation,
     pa.transcript_text,
     ps.accessibility_mode_json
@@ -0,0 +1,62 @@
+"""
+Shared test setup.
+
+Stubs the heavy SDK modules that the app imports at module level but the
+tests never actually execute (every test patches at the service layer, e.g.
+``app.services.storage.upload_audio``). Collection then skips the boto3 and
+snowflake-connector import cost on a cold interpreter.
+"""
+
+import sys
+import types
+
+import pytest
+import pytest_asyncio
+
+
+def _stub(name: str, **attrs):
+    """Installs a no-op module stub unless the real module is already loaded."""
+    if name in sys.modules:
+        return
+    mod = types.ModuleType(name)
+    for key, value in attrs.items():
+        setattr(mod, key, value)
+    sys.modules[name] = mod
+    parent, _, child = name.rpartition(".")
+    if parent:
+        _stub(parent)
+        setattr(sys.modules[parent], child, mod)
+
+
+class _StubConfig:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+_stub("boto3")
+_stub("botocore.client", Config=_StubConfig)
+_stub("snowflake.connector")
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session, with the app lifespan run
+    exactly once (the context manager fires startup/shutdown)."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    """Async in-process client. Unlike the sync TestClient, concurrent
+    requests awaited together genuinely overlap on one event loop."""
+    import httpx
+    from app.main import app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
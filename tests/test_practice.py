@@ -2,26 +2,54 @@
 EduVoice Backend Tests — Practice speech analysis
 """
 
-import io
-import json
 import pytest
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
+
+from app.dependencies import get_current_user
+from app.models.schemas import CurrentUser
+from app.utils.prompts import build_speech_analysis_prompt
+
+# The shared session-scoped `client` fixture lives in conftest.py.
+
+_STUDENT = CurrentUser(user_id="student_001", email="student@school.com", role="student")
+
+_FAKE_WAV = b"RIFF" + b"\x00" * 40
 
 
 @pytest.fixture
-def client():
-    from app.main import app
-    return TestClient(app)
+def auth_as_student(client):
+    client.app.dependency_overrides[get_current_user] = lambda: _STUDENT
+    yield
+    client.app.dependency_overrides.pop(get_current_user, None)
 
 
-MOCK_ANALYSIS = {
+@pytest.fixture
+def mock_services(monkeypatch):
+    """Stubs the analyze pipeline's external services in one fixture — a
+    monkeypatch.setattr per service instead of a stack of @patch decorators."""
+    mocks = SimpleNamespace(
+        stt=AsyncMock(return_value="I went to the school yesterday and learned many new things."),
+        analyze=AsyncMock(return_value=MOCK_ANALYSIS),
+        upload=AsyncMock(return_value="https://spaces.example.com/recordings/sess_001/student_audio.mp3"),
+        save=AsyncMock(return_value=None),
+    )
+    monkeypatch.setattr("app.services.elevenlabs.stt", mocks.stt)
+    monkeypatch.setattr("app.services.gemini.analyze_speech", mocks.analyze)
+    monkeypatch.setattr("app.services.storage.upload_audio", mocks.upload)
+    monkeypatch.setattr("app.services.snowflake_db.save_artifact", mocks.save)
+    return mocks
+
+
+# Read-only — a mapping proxy guards against a test (or the route under
+# test) mutating shared fixture data between cases.
+MOCK_ANALYSIS = MappingProxyType({
     "scores": {"fluency": 7.5, "grammar": 8.0, "confidence": 6.5, "pronunciation": 7.0},
     "feedback_text": "Great effort! Your grammar is improving well. Keep practising pronunciation.",
     "word_marks": [{"word": "practising", "issue": "mispronounced", "suggestion": "PRAK-ti-sing"}],
     "strengths": ["clear sentence structure", "good vocabulary"],
     "next_steps": ["Focus on vowel sounds"],
-}
+})
 
 
 class TestPracticeSession:
@@ -29,57 +57,42 @@ class TestPracticeSession:
         resp = client.post("/practice/session/start", json={"mode": "read-aloud"})
         assert resp.status_code == 403
 
-    def test_get_session_not_found(self, client):
+    def test_get_session_no_auth(self, client):
         resp = client.get("/practice/session/nonexistent-id")
-        # Without auth → 403; with auth, nonexistent → checked below
-        assert resp.status_code in (403, 404)
+        assert resp.status_code == 403  # No credentials provided
 
 
 class TestSpeechAnalyze:
     def test_analyze_no_auth(self, client):
-        fake_audio = io.BytesIO(b"RIFF" + b"\x00" * 40)
         resp = client.post(
             "/practice/speech-analyze",
             data={"session_id": "sess_001", "mode": "read-aloud", "accessibility_json": "{}"},
-            files={"audio": ("test.wav", fake_audio, "audio/wav")},
+            files={"audio": ("test.wav", _FAKE_WAV, "audio/wav")},
         )
         assert resp.status_code == 403
 
-    @patch("app.services.gemini.transcribe_audio", new_callable=AsyncMock)
-    @patch("app.services.gemini.analyze_speech", new_callable=AsyncMock)
-    @patch("app.services.storage.upload_audio")
-    @patch("app.services.snowflake_db.save_artifact", new_callable=AsyncMock)
-    def test_analyze_scores_structure(
-        self, mock_save, mock_upload, mock_analyze, mock_transcribe, client
-    ):
-        mock_transcribe.return_value = "I went to the school yesterday and learned many new things."
-        mock_analyze.return_value = MOCK_ANALYSIS
-        mock_upload.return_value = "https://spaces.example.com/recordings/sess_001/student_audio.mp3"
-        mock_save.return_value = None
-
-        # Validate the MOCK_ANALYSIS structure matches our schema expectations
-        scores = MOCK_ANALYSIS["scores"]
-        assert "fluency" in scores
-        assert "grammar" in scores
-        assert "confidence" in scores
-        assert "pronunciation" in scores
-        assert all(0 <= v <= 10 for v in scores.values())
-
-    def test_stammer_friendly_prompt_flag(self):
-        """Validate stammer-friendly addendum doesn't appear in non-stammer prompts."""
-        from app.utils.prompts import build_speech_analysis_prompt
-        _, user_prompt = build_speech_analysis_prompt("test transcript", "read-aloud", stammer_friendly=False)
-        assert "STAMMER-FRIENDLY" not in user_prompt
-
-        _, user_prompt_sf = build_speech_analysis_prompt("test transcript", "read-aloud", stammer_friendly=True)
-        assert "STAMMER-FRIENDLY" in user_prompt_sf
-
-    def test_neurodivergent_prompt_flag(self):
-        from app.utils.prompts import build_speech_analysis_prompt
-        _, nd_prompt = build_speech_analysis_prompt("test", "mock-interview", neurodivergent=True)
-        assert "NEURODIVERGENT" in nd_prompt
+    def test_analyze_scores_structure(self, mock_services, client, auth_as_student):
+        resp = client.post(
+            "/practice/speech-analyze",
+            data={"session_id": "sess_001", "mode": "read-aloud", "accessibility_json": "{}"},
+            files={"audio": ("test.wav", _FAKE_WAV, "audio/wav")},
+        )
 
-    def test_hearing_impaired_prompt_flag(self):
-        from app.utils.prompts import build_speech_analysis_prompt
-        _, hi_prompt = build_speech_analysis_prompt("test", "read-aloud", hearing_impaired=True)
-        assert "HEARING IMPAIRED" in hi_prompt
+        assert resp.status_code == 200
+        scores = resp.json()["scores"]
+        assert set(scores) == {"fluency", "grammar", "confidence", "pronunciation"}
+        assert all(0 <= v <= 10 for v in scores.values())
+        mock_services.save.assert_called_once()
+
+    @pytest.mark.parametrize("kwarg,needle", [
+        ("stammer_friendly", "STAMMER-FRIENDLY"),
+        ("neurodivergent", "NEURODIVERGENT"),
+        ("hearing_impaired", "HEARING IMPAIRED"),
+    ])
+    def test_accessibility_prompt_flag(self, kwarg, needle):
+        """Each addendum appears only when its flag is set."""
+        _, plain_prompt = build_speech_analysis_prompt("test transcript", "read-aloud")
+        assert needle not in plain_prompt
+
+        _, flagged_prompt = build_speech_analysis_prompt("test transcript", "read-aloud", **{kwarg: True})
+        assert needle in flagged_prompt